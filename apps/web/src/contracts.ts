@@ -111,11 +111,31 @@ export type OutgoingMessage =
   | { type: 'client_mindmap_action'; action: MindmapAction }
   | { type: 'run_ai' }
   | { type: 'reset' }
+  | { type: 'sync' }
 
+// Changed entries keyed by id; `null` removes the entry.
+export type EntriesPatch<T> = Record<string, T | null>
+
+export type BoardStatePatch = {
+  cards: EntriesPatch<Card>
+  layout: EntriesPatch<Rect>
+  dismissed: EntriesPatch<string>
+}
+
+export type MindmapStatePatch = {
+  root_id?: string
+  nodes: EntriesPatch<MindmapNode>
+  layout: EntriesPatch<MindmapPoint>
+}
+
+// Carries either the full `state`, or a `patch` that turns the state at `base_version` into `version`.
 export type IncomingBoardActionsMessage = {
   type: 'board_actions'
   actions: unknown[]
-  state: BoardState
+  version?: number
+  state?: BoardState
+  base_version?: number
+  patch?: BoardStatePatch
 }
 
 export type IncomingBoardExportMessage = {
@@ -128,7 +148,10 @@ export type IncomingBoardExportMessage = {
 export type IncomingMindmapActionsMessage = {
   type: 'mindmap_actions'
   actions: MindmapAction[]
-  state: MindmapState
+  version?: number
+  state?: MindmapState
+  base_version?: number
+  patch?: MindmapStatePatch
 }
 
 export type MindmapStatus = 'idle' | 'running'
@@ -150,6 +173,33 @@ export type IncomingMessage =
   | IncomingStatusMessage
   | IncomingErrorMessage
 
+// Broadcasts queued close together arrive as one frame; `messages` are in send order.
+export type IncomingBatchMessage = { type: 'batch'; messages: IncomingMessage[] }
+
+export function applyEntriesPatch<T>(entries: Record<string, T>, patch: EntriesPatch<T>): Record<string, T> {
+  const keys = Object.keys(patch)
+  if (keys.length === 0) return entries
+  const next = { ...entries }
+  for (const key of keys) {
+    const value = patch[key]
+    if (value === null) delete next[key]
+    else next[key] = value
+  }
+  return next
+}
+
+export const applyBoardStatePatch = (state: BoardState, patch: BoardStatePatch): BoardState => ({
+  cards: applyEntriesPatch(state.cards, patch.cards),
+  layout: applyEntriesPatch(state.layout, patch.layout),
+  dismissed: applyEntriesPatch(state.dismissed, patch.dismissed),
+})
+
+export const applyMindmapStatePatch = (state: MindmapState, patch: MindmapStatePatch): MindmapState => ({
+  root_id: patch.root_id ?? state.root_id,
+  nodes: applyEntriesPatch(state.nodes, patch.nodes),
+  layout: applyEntriesPatch(state.layout, patch.layout),
+})
+
 export const emptyBoardState = (): BoardState => ({
   cards: {},
   layout: {},
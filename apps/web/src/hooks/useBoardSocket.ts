@@ -1,6 +1,7 @@
 import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
 import type {
   BoardState,
+  IncomingBatchMessage,
   IncomingBoardExportMessage,
   IncomingErrorMessage,
   IncomingMessage,
@@ -10,7 +11,12 @@ import type {
   OutgoingMessage,
   TranscriptEvent,
 } from '../contracts'
-import { emptyBoardState, emptyMindmapState } from '../contracts'
+import {
+  applyBoardStatePatch,
+  applyMindmapStatePatch,
+  emptyBoardState,
+  emptyMindmapState,
+} from '../contracts'
 import {
   recordBoardActionsReceived,
   recordConnectionStateChanged,
@@ -53,6 +59,12 @@ export function useBoardSocket(): {
   const socketRef = useRef<WebSocket | null>(null)
   const reconnectTimerRef = useRef<number | null>(null)
   const shouldReconnectRef = useRef(true)
+  // Latest states (and their server versions) for applying incremental patches as messages arrive.
+  const boardStateRef = useRef<BoardState>(emptyBoardState())
+  const boardVersionRef = useRef<number | null>(null)
+  const mindmapStateRef = useRef<MindmapState>(emptyMindmapState())
+  const mindmapVersionRef = useRef<number | null>(null)
+  const syncPendingRef = useRef(false)
 
   const [connectionState, setConnectionState] = useState<ConnectionState>('connecting')
   const [lastStatusMessage, setLastStatusMessage] = useState<string | null>(null)
@@ -119,8 +131,10 @@ export function useBoardSocket(): {
   const sendReset = useCallback(() => {
     sendMessage({ type: 'reset' })
     setLastStatusMessage(null)
-    setBoardState(emptyBoardState())
-    setMindmapState(emptyMindmapState())
+    boardStateRef.current = emptyBoardState()
+    setBoardState(boardStateRef.current)
+    mindmapStateRef.current = emptyMindmapState()
+    setMindmapState(mindmapStateRef.current)
     setMindmapStatus('idle')
   }, [sendMessage])
 
@@ -136,6 +150,9 @@ export function useBoardSocket(): {
     socketRef.current = socket
 
     socket.addEventListener('open', () => {
+      boardVersionRef.current = null
+      mindmapVersionRef.current = null
+      syncPendingRef.current = false
       setConnectionState('open')
       setLastStatusMessage(null)
       setLastError(null)
@@ -143,44 +160,86 @@ export function useBoardSocket(): {
       recordConnectionStateChanged('open')
     })
 
-    socket.addEventListener('message', (event) => {
-      try {
-        const parsed: unknown = JSON.parse(String(event.data))
-        const message = parsed as IncomingMessage
-        if (!message || typeof message !== 'object' || !('type' in message)) return
+    // A patch only applies on top of the state it was computed from; otherwise ask for full state.
+    const requestSync = () => {
+      if (syncPendingRef.current || socket.readyState !== WebSocket.OPEN) return
+      syncPendingRef.current = true
+      const message: OutgoingMessage = { type: 'sync' }
+      socket.send(JSON.stringify(message))
+    }
 
-        if (message.type === 'status') {
-          setLastStatusMessage(message.message)
-          return
-        }
+    const handleMessage = (message: IncomingMessage) => {
+      if (!message || typeof message !== 'object' || !('type' in message)) return
 
-        if (message.type === 'error') {
-          setLastError(message)
-          setLastStatusMessage(message.message)
-          recordServerErrorReceived(message)
-          return
-        }
+      if (message.type === 'status') {
+        setLastStatusMessage(message.message)
+        return
+      }
 
-        if (message.type === 'board_actions') {
-          recordBoardActionsReceived(message)
-          setBoardState(message.state ?? emptyBoardState())
-          return
-        }
+      if (message.type === 'error') {
+        setLastError(message)
+        setLastStatusMessage(message.message)
+        recordServerErrorReceived(message)
+        return
+      }
 
-        if (message.type === 'mindmap_actions') {
-          setMindmapState(message.state ?? emptyMindmapState())
-          return
+      if (message.type === 'board_actions') {
+        let next: BoardState
+        if (message.patch) {
+          if (message.base_version === undefined || message.base_version !== boardVersionRef.current) {
+            requestSync()
+            return
+          }
+          next = applyBoardStatePatch(boardStateRef.current, message.patch)
+        } else {
+          next = message.state ?? emptyBoardState()
+          syncPendingRef.current = false
         }
+        boardStateRef.current = next
+        boardVersionRef.current = message.version ?? null
+        recordBoardActionsReceived(message, next)
+        setBoardState(next)
+        return
+      }
 
-        if (message.type === 'mindmap_status') {
-          setMindmapStatus(message.status ?? 'idle')
-          return
+      if (message.type === 'mindmap_actions') {
+        let next: MindmapState
+        if (message.patch) {
+          if (message.base_version === undefined || message.base_version !== mindmapVersionRef.current) {
+            requestSync()
+            return
+          }
+          next = applyMindmapStatePatch(mindmapStateRef.current, message.patch)
+        } else {
+          next = message.state ?? emptyMindmapState()
+          syncPendingRef.current = false
         }
+        mindmapStateRef.current = next
+        mindmapVersionRef.current = message.version ?? null
+        setMindmapState(next)
+        return
+      }
+
+      if (message.type === 'mindmap_status') {
+        setMindmapStatus(message.status ?? 'idle')
+        return
+      }
 
-        if (message.type === 'board_export') {
-          setLastBoardExport(message)
+      if (message.type === 'board_export') {
+        setLastBoardExport(message)
+        return
+      }
+    }
+
+    socket.addEventListener('message', (event) => {
+      try {
+        const parsed: unknown = JSON.parse(String(event.data))
+        const message = parsed as IncomingMessage | IncomingBatchMessage
+        if (message && typeof message === 'object' && message.type === 'batch') {
+          if (Array.isArray(message.messages)) message.messages.forEach(handleMessage)
           return
         }
+        handleMessage(message as IncomingMessage)
       } catch {
         // ignore malformed messages in prototype
       }
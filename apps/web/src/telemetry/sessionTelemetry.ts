@@ -1,4 +1,5 @@
 import type {
+  BoardState,
   Card,
   CardKind,
   IncomingBoardActionsMessage,
@@ -182,13 +183,13 @@ export function recordTranscriptEventSent(event: TranscriptEvent): void {
   pushEvent({ type: 'transcript_event_sent', ts: nowIso(), event })
 }
 
-export function recordBoardActionsReceived(message: IncomingBoardActionsMessage): void {
+export function recordBoardActionsReceived(message: IncomingBoardActionsMessage, state: BoardState): void {
   pushEvent({
     type: 'board_actions_received',
     ts: nowIso(),
     actions_count: Array.isArray(message.actions) ? message.actions.length : 0,
-    cards_count: message.state?.cards ? Object.keys(message.state.cards).length : 0,
-    card_kinds: summarizeCardKinds(message.state?.cards),
+    cards_count: state.cards ? Object.keys(state.cards).length : 0,
+    card_kinds: summarizeCardKinds(state.cards),
   })
 }
 
@@ -2,17 +2,27 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import json
 import os
 import sys
 import time
-from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable, NamedTuple
+
+try:
+  import orjson
+except ModuleNotFoundError:
+  # Optional speedup; fall back to the stdlib json module.
+  orjson = None  # type: ignore[assignment]
 
 
 DEFAULT_WS_URL = "ws://localhost:8000/ws"
 
+_STR_FRAME_MARKERS: tuple[str, ...] = ('"board_actions"', '"status"', '"error"')
+_BYTES_FRAME_MARKERS: tuple[bytes, ...] = tuple(m.encode("utf-8") for m in _STR_FRAME_MARKERS)
+
 
 def _env_float(name: str, default: float) -> float:
   val = os.getenv(name)
@@ -28,79 +38,175 @@ def _now_iso() -> str:
   return datetime.now(tz=UTC).isoformat()
 
 
+def _json_loads(raw: str | bytes | bytearray) -> Any:
+  if orjson is not None:
+    return orjson.loads(raw)
+  return json.loads(raw)
+
+
+def _json_dumps(value: Any) -> bytes:
+  # Commands go out as binary frames: no str -> bytes re-encode in `ws.send()`.
+  if orjson is not None:
+    return orjson.dumps(value)
+  return json.dumps(value).encode("utf-8")
+
+
+_SYNC_CMD = _json_dumps({"type": "sync"})
+
+
+def _transcript_command(text: str) -> bytes:
+  return _json_dumps(
+    {
+      "type": "transcript_event",
+      "event": {
+        "timestamp": _now_iso(),
+        "speaker": "User",
+        "text": text,
+        "is_final": True,
+      },
+    }
+  )
+
+
 def _as_dict(value: Any) -> dict[str, Any] | None:
   if isinstance(value, dict):
     return value
   return None
 
 
-@dataclass(frozen=True)
-class FoundCard:
+class FoundCard(NamedTuple):
   card_id: str
   kind: str
   title: str
 
 
-@dataclass(frozen=True)
-class CardScan:
+class CardScan(NamedTuple):
   chart_candidates: list[FoundCard]
   list_candidates: list[FoundCard]
   chart_good: list[FoundCard]
   list_good: list[FoundCard]
 
 
-def _scan_cards(state: dict[str, Any]) -> CardScan:
-  cards = _as_dict(state.get("cards")) or {}
-  chart_candidates: list[FoundCard] = []
-  list_candidates: list[FoundCard] = []
-  chart_good: list[FoundCard] = []
-  list_good: list[FoundCard] = []
+def _changed_card_ids(actions: Any) -> list[str] | None:
+  if not isinstance(actions, list) or not actions:
+    # Initial/reset/import frames carry a full state with no actions.
+    return None
+  card_ids: list[str] = []
+  for raw_action in actions:
+    action = _as_dict(raw_action)
+    if not action:
+      return None
+    card_id = action.get("card_id")
+    if card_id is None:
+      card_id = (_as_dict(action.get("card")) or {}).get("card_id")
+    if not isinstance(card_id, str):
+      return None
+    card_ids.append(card_id)
+  return list(dict.fromkeys(card_ids))
+
+
+def _scan_cards(state: dict[str, Any], *, card_ids: list[str] | None = None) -> CardScan:
+  cards = _as_dict(state.get("cards"))
+  if not cards or card_ids == []:
+    return CardScan(chart_candidates=[], list_candidates=[], chart_good=[], list_good=[])
+  entries = cards.items() if card_ids is None else [(cid, cards[cid]) for cid in card_ids if cid in cards]
+
+  # Hot loop: bind the builtins/methods used per card once.
+  _isinstance = isinstance
+  _dict = dict
+  _list = list
+  _str = str
+  _FoundCard = FoundCard
+  # Card ids recur across every frame; interning lets the seen/board dicts hit the identity fast path.
+  _intern = sys.intern
+  classified: list[tuple[FoundCard, bool]] = []
+  add = classified.append
+
+  for card_id, card in entries:
+    if not _isinstance(card, _dict) or not card:
+      continue
 
-  for card_id, raw_card in cards.items():
-    card = _as_dict(raw_card)
-    if not card:
+    get = card.get
+    kind = get("kind")
+    if kind == "chart":
+      content_key = "points"
+    elif kind == "list":
+      content_key = "items"
+    else:
       continue
 
-    kind = card.get("kind")
-    props = _as_dict(card.get("props")) or {}
-    sources = card.get("sources")
-    sources_ok = isinstance(sources, list) and len(sources) > 0
+    props = get("props")
+    if not _isinstance(props, _dict):
+      props = {}
+    props_get = props.get
+    content = props_get(content_key)
+    if not _isinstance(content, _list) or not content:
+      continue
 
-    title = props.get("title")
-    if not isinstance(title, str) or not title.strip():
-      title = str(title) if title is not None else "(untitled)"
+    sources = get("sources")
+    sources_ok = _isinstance(sources, _list) and len(sources) > 0
 
-    if kind == "chart":
-      points = props.get("points")
-      if isinstance(points, list) and len(points) > 0:
-        found = FoundCard(card_id=str(card_id), kind="chart", title=title)
-        chart_candidates.append(found)
-        if sources_ok:
-          chart_good.append(found)
-    elif kind == "list":
-      items = props.get("items")
-      if isinstance(items, list) and len(items) > 0:
-        found = FoundCard(card_id=str(card_id), kind="list", title=title)
-        list_candidates.append(found)
-        if sources_ok:
-          list_good.append(found)
+    title = props_get("title")
+    if not _isinstance(title, _str):
+      title = "(untitled)" if title is None else _str(title)
+
+    add((_FoundCard(_intern(_str(card_id)), kind, title), sources_ok))
 
+  charts = [(c, ok) for c, ok in classified if c.kind == "chart"]
+  lists = [(c, ok) for c, ok in classified if c.kind == "list"]
   return CardScan(
-    chart_candidates=chart_candidates,
-    list_candidates=list_candidates,
-    chart_good=chart_good,
-    list_good=list_good,
+    chart_candidates=[c for c, _ in charts],
+    list_candidates=[c for c, _ in lists],
+    chart_good=[c for c, ok in charts if ok],
+    list_good=[c for c, ok in lists if ok],
   )
 
 
-async def _wait_for(
-  ws: Any,
-  *,
-  deadline: float,
-  predicate: Callable[[dict[str, Any]], bool],
-  label: str,
-  on_state: Callable[[dict[str, Any]], None] | None = None,
-) -> dict[str, Any]:
+def _raw_recv(ws: Any) -> Callable[[], Awaitable[Any]]:
+  # websockets >= 13 can hand back text frames as raw bytes; the JSON parser validates UTF-8
+  # itself, so skip the extra decode pass when it's supported.
+  try:
+    params = inspect.signature(ws.recv).parameters
+  except (TypeError, ValueError):
+    return ws.recv
+  if "decode" in params:
+    return functools.partial(ws.recv, decode=False)
+  return ws.recv
+
+
+class _BoardMirror:
+  def __init__(self) -> None:
+    self.state: dict[str, Any] | None = None
+    self.version: Any = None
+    self.sync_pending = False
+
+  def apply(self, frame: dict[str, Any]) -> dict[str, Any] | None:
+    # None: the patch doesn't apply to the local copy.
+    state = _as_dict(frame.get("state"))
+    if state is not None:
+      self.state = state
+      self.sync_pending = False
+    else:
+      patch = _as_dict(frame.get("patch"))
+      if patch is None or self.state is None or frame.get("base_version") != self.version:
+        return None
+      for section, entries in patch.items():
+        current = _as_dict(self.state.get(section))
+        if current is None or not isinstance(entries, dict):
+          continue
+        for key, value in entries.items():
+          if value is None:
+            current.pop(key, None)
+          else:
+            current[key] = value
+    self.version = frame.get("version")
+    return self.state
+
+
+async def _iter_states(
+  ws: Any, board: _BoardMirror, *, deadline: float, label: str
+) -> AsyncIterator[tuple[dict[str, Any], Any]]:
+  recv = _raw_recv(ws)
   last_error: str | None = None
   last_status: str | None = None
   while True:
@@ -114,12 +220,21 @@ async def _wait_for(
       extra_msg = f" ({', '.join(extra)})" if extra else ""
       raise TimeoutError(f"Timed out waiting for {label}.{extra_msg}")
 
-    raw = await asyncio.wait_for(ws.recv(), timeout=remaining)
-    if not isinstance(raw, (str, bytes, bytearray)):
+    raw = await asyncio.wait_for(recv(), timeout=remaining)
+    if isinstance(raw, str):
+      markers = _STR_FRAME_MARKERS
+    elif isinstance(raw, (bytes, bytearray)):
+      markers = _BYTES_FRAME_MARKERS
+    else:
+      continue
+
+    # Only board_actions frames carry the state we check; status/error frames are tiny and only
+    # kept for timeout diagnostics. Skip parsing everything else (e.g. large mindmap_actions).
+    if not any(marker in raw for marker in markers):
       continue
 
     try:
-      msg = json.loads(raw)
+      msg = _json_loads(raw)
     except Exception:
       continue
 
@@ -127,23 +242,38 @@ async def _wait_for(
     if not msg_obj:
       continue
 
-    msg_type = msg_obj.get("type")
-    if msg_type == "status":
-      last_status = str(msg_obj.get("message"))
-      continue
-    if msg_type == "error":
-      last_error = str(msg_obj.get("message"))
-      continue
-    if msg_type != "board_actions":
-      continue
-
-    state = _as_dict(msg_obj.get("state"))
-    if not state:
-      continue
-    if on_state is not None:
-      on_state(state)
-    if predicate(state):
-      return state
+    # The server coalesces broadcasts queued close together into one `batch` frame.
+    if msg_obj.get("type") == "batch":
+      batched = msg_obj.get("messages")
+      frames = [f for f in map(_as_dict, batched) if f is not None] if isinstance(batched, list) else []
+    else:
+      frames = [msg_obj]
+
+    # Apply every board frame in the batch before yielding, so a caller that stops at the first match
+    # still leaves the mirror at the batch's final version.
+    applied: list[Any] = []
+    for frame in frames:
+      msg_type = frame.get("type")
+      if msg_type == "status":
+        last_status = str(frame.get("message"))
+        continue
+      if msg_type == "error":
+        last_error = str(frame.get("message"))
+        continue
+      if msg_type != "board_actions":
+        continue
+
+      if board.apply(frame) is None:
+        if not board.sync_pending:
+          board.sync_pending = True
+          await ws.send(_SYNC_CMD)
+        continue
+      # Full-state frames (initial/reset/import/sync) always get a full rescan.
+      applied.append(None if "state" in frame else frame.get("actions"))
+
+    for actions in applied:
+      if board.state is not None:
+        yield board.state, actions
 
 
 async def _run() -> int:
@@ -158,84 +288,73 @@ async def _run() -> int:
   timeout_s = _env_float("MEETINGGENIUS_SMOKE_TIMEOUT_S", 180.0)
   deadline = time.monotonic() + timeout_s
 
-  seen_chart_candidates: dict[str, FoundCard] = {}
-  seen_list_candidates: dict[str, FoundCard] = {}
-  seen_charts: dict[str, FoundCard] = {}
-  seen_lists: dict[str, FoundCard] = {}
-
-  def observe(state: dict[str, Any]) -> None:
-    scan = _scan_cards(state)
+  # Every chart/list candidate seen during the run (for the final report), plus the ids that were
+  # ever seen with sources.
+  seen: dict[str, FoundCard] = {}
+  seen_good: set[str] = set()
+
+  def seen_cards(kind: str, *, good: bool) -> list[FoundCard]:
+    return sorted(c for c in seen.values() if c.kind == kind and (not good or c.card_id in seen_good))
+
+  # Charts/lists with props+sources on the *current* board. Only the cards touched by each frame's
+  # actions are rescanned, so the wait conditions below are O(1) checks on these dicts.
+  board_charts: dict[str, FoundCard] = {}
+  board_lists: dict[str, FoundCard] = {}
+
+  def observe(state: dict[str, Any], actions: Any) -> None:
+    changed = _changed_card_ids(actions)
+    if changed is None:
+      board_charts.clear()
+      board_lists.clear()
+    else:
+      for card_id in changed:
+        board_charts.pop(card_id, None)
+        board_lists.pop(card_id, None)
+
+    scan = _scan_cards(state, card_ids=changed)
     for c in scan.chart_candidates:
-      seen_chart_candidates[c.card_id] = c
+      seen[c.card_id] = c
     for c in scan.list_candidates:
-      seen_list_candidates[c.card_id] = c
+      seen[c.card_id] = c
     for c in scan.chart_good:
-      seen_charts[c.card_id] = c
+      seen_good.add(c.card_id)
+      board_charts[c.card_id] = c
     for c in scan.list_good:
-      seen_lists[c.card_id] = c
+      seen_good.add(c.card_id)
+      board_lists[c.card_id] = c
+
+  # Serialize every command up front so the send path is just a frame write between waits.
+  board = _BoardMirror()
+  reset_cmd = _json_dumps({"type": "reset"})
+  chart_cmd = _transcript_command("Show the temperature trends for December over the last 10 years.")
+  list_cmd = _transcript_command("Pull the top December headlines for the last 5 years.")
 
   print(f"Connecting: {ws_url}")
   try:
     async with websockets.connect(ws_url) as ws:
-      await _wait_for(
-        ws,
-        deadline=deadline,
-        predicate=lambda _s: True,
-        label="initial board state",
-        on_state=observe,
-      )
-      await ws.send(json.dumps({"type": "reset"}))
-      await _wait_for(
-        ws,
-        deadline=deadline,
-        predicate=lambda s: len((_as_dict(s.get("cards")) or {})) == 0,
-        label="reset board state",
-        on_state=observe,
-      )
-
-      await ws.send(
-        json.dumps(
-          {
-            "type": "transcript_event",
-            "event": {
-              "timestamp": _now_iso(),
-              "speaker": "User",
-              "text": "Show the temperature trends for December over the last 10 years.",
-              "is_final": True,
-            },
-          }
-        )
-      )
-
-      await _wait_for(
-        ws,
-        deadline=deadline,
-        predicate=lambda s: len(_scan_cards(s).chart_good) > 0,
-        label="chart card with points+sources",
-        on_state=observe,
-      )
-
-      await ws.send(
-        json.dumps(
-          {
-            "type": "transcript_event",
-            "event": {
-              "timestamp": _now_iso(),
-              "speaker": "User",
-              "text": "Pull the top December headlines for the last 5 years.",
-              "is_final": True,
-            },
-          }
-        )
-      )
-
-      await _wait_for(
-        ws,
-        deadline=deadline,
-        predicate=lambda s: len(_scan_cards(s).chart_good) > 0 and len(_scan_cards(s).list_good) > 0,
-        label="chart+list cards with props+sources",
-        on_state=observe,
-      )
+      async for state, actions in _iter_states(ws, board, deadline=deadline, label="initial board state"):
+        observe(state, actions)
+        break
+
+      await ws.send(reset_cmd)
+      async for state, actions in _iter_states(ws, board, deadline=deadline, label="reset board state"):
+        observe(state, actions)
+        if not _as_dict(state.get("cards")):
+          break
+
+      await ws.send(chart_cmd)
+      async for state, actions in _iter_states(ws, board, deadline=deadline, label="chart card with points+sources"):
+        observe(state, actions)
+        if board_charts:
+          break
+
+      await ws.send(list_cmd)
+      async for state, actions in _iter_states(
+        ws, board, deadline=deadline, label="chart+list cards with props+sources"
+      ):
+        observe(state, actions)
+        if board_charts and board_lists:
+          break
   except OSError as e:
     print("\nFAIL: cannot connect to WebSocket.", file=sys.stderr)
     print(f"- url={ws_url!r}", file=sys.stderr)
@@ -245,32 +364,42 @@ async def _run() -> int:
   except TimeoutError as e:
     print(f"\nFAIL: {e}", file=sys.stderr)
     print("\nChart candidates (points present, sources may be missing):", file=sys.stderr)
-    for c in sorted(seen_chart_candidates.values(), key=lambda x: x.card_id):
+    for c in seen_cards("chart", good=False):
       print(f"- {c.card_id}: {c.title}", file=sys.stderr)
     print("\nCharts found (points+sources):", file=sys.stderr)
-    for c in sorted(seen_charts.values(), key=lambda x: x.card_id):
+    for c in seen_cards("chart", good=True):
       print(f"- {c.card_id}: {c.title}", file=sys.stderr)
     print("\nList candidates (items present, sources may be missing):", file=sys.stderr)
-    for c in sorted(seen_list_candidates.values(), key=lambda x: x.card_id):
+    for c in seen_cards("list", good=False):
       print(f"- {c.card_id}: {c.title}", file=sys.stderr)
     print("\nLists found (items+sources):", file=sys.stderr)
-    for c in sorted(seen_lists.values(), key=lambda x: x.card_id):
+    for c in seen_cards("list", good=True):
       print(f"- {c.card_id}: {c.title}", file=sys.stderr)
     return 1
 
   print("\nPASS: demo smoke test satisfied.")
   print("\nChart cards (points+sources):")
-  for c in sorted(seen_charts.values(), key=lambda x: x.card_id):
+  for c in seen_cards("chart", good=True):
     print(f"- {c.card_id}: {c.title}")
   print("\nList cards (items+sources):")
-  for c in sorted(seen_lists.values(), key=lambda x: x.card_id):
+  for c in seen_cards("list", good=True):
     print(f"- {c.card_id}: {c.title}")
   return 0
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+  try:
+    import uvloop  # type: ignore[import-not-found]
+  except ModuleNotFoundError:
+    # Optional speedup; the default asyncio loop works fine.
+    return None
+  return uvloop.new_event_loop
+
+
 def main() -> None:
   try:
-    code = asyncio.run(_run())
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+      code = runner.run(_run())
   except KeyboardInterrupt:
     print("\nFAIL: interrupted", file=sys.stderr)
     sys.exit(130)
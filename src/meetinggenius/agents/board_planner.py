@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from pydantic_ai import Agent
 
-from meetinggenius.contracts import BoardAction, BoardState, OrchestratorDecision, ResearchResult, ToolingPolicy
+from meetinggenius.agents.prompt_cache import prompt_cache_settings
+from meetinggenius.contracts import (
+  BoardAction,
+  BoardState,
+  OrchestratorDecision,
+  ResearchResult,
+  ToolingPolicy,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoardPlannerDeps:
   policy: ToolingPolicy
   board_state: BoardState = field(default_factory=BoardState.empty)
@@ -119,11 +127,13 @@ Example B (existing list card → update items + sources from headlines research
 """.strip()
 
 
+@lru_cache(maxsize=8)
 def build_board_planner_agent(model: str) -> Agent[BoardPlannerDeps, list[BoardAction]]:
   return Agent(
     model=model,
     output_type=list[BoardAction],
     system_prompt=SYSTEM_PROMPT,
+    model_settings=prompt_cache_settings("board_planner", SYSTEM_PROMPT),
     deps_type=BoardPlannerDeps,
     retries=2,
     defer_model_check=True,
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_ai import Agent
+
+from meetinggenius.agents.board_planner import SYSTEM_PROMPT as BOARD_PLANNER_SYSTEM_PROMPT
+from meetinggenius.agents.orchestrator import SYSTEM_PROMPT as ORCHESTRATOR_SYSTEM_PROMPT
+from meetinggenius.agents.prompt_cache import prompt_cache_settings
+from meetinggenius.contracts import BoardAction, BoardState, OrchestratorDecision, ToolingPolicy
+
+
+@dataclass(frozen=True, slots=True)
+class CombinedPlannerDeps:
+  policy: ToolingPolicy
+  default_location: str | None = None
+  board_state: BoardState = field(default_factory=BoardState.empty)
+
+
+class CombinedDecision(BaseModel):
+  model_config = ConfigDict(extra="forbid")
+
+  decision: OrchestratorDecision = Field(
+    default_factory=OrchestratorDecision,
+    description="What you would have output as the orchestrator (step 1).",
+  )
+  actions: list[BoardAction] = Field(
+    default_factory=list,
+    description="The BoardActions you would have output as the board planner (step 2).",
+  )
+
+
+SYSTEM_PROMPT = f"""
+You do the work of two agents in a single response, for turns where no research results will be available
+(external research is disabled):
+
+1. Orchestrator: decide what would be helpful on the shared whiteboard.
+2. Board planner: turn that decision into concrete BoardActions.
+
+Output a CombinedDecision: put the orchestrator output in `decision` and the board planner output in `actions`.
+Since no research results will exist, follow the planner's rules for missing research (never invent factual data);
+meeting-native list cards are still expected.
+
+=== Step 1: orchestrator instructions ===
+
+{ORCHESTRATOR_SYSTEM_PROMPT}
+
+=== Step 2: board planner instructions ===
+
+{BOARD_PLANNER_SYSTEM_PROMPT}
+""".strip()
+
+
+@lru_cache(maxsize=8)
+def build_combined_planner_agent(model: str) -> Agent[CombinedPlannerDeps, CombinedDecision]:
+  return Agent(
+    model=model,
+    output_type=CombinedDecision,
+    system_prompt=SYSTEM_PROMPT,
+    model_settings=prompt_cache_settings("combined_planner", SYSTEM_PROMPT),
+    deps_type=CombinedPlannerDeps,
+    retries=2,
+    defer_model_check=True,
+  )
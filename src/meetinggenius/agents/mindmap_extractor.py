@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic_ai import Agent
 
+from meetinggenius.agents.prompt_cache import prompt_cache_settings
 from meetinggenius.contracts import MindmapState, ToolingPolicy
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MindmapExtractorDeps:
   policy: ToolingPolicy
   mindmap_state: MindmapState = field(default_factory=MindmapState.empty)
@@ -55,11 +57,13 @@ Rules:
 """.strip()
 
 
+@lru_cache(maxsize=8)
 def build_mindmap_extractor_agent(model: str) -> Agent[MindmapExtractorDeps, list[MindmapPathProposal]]:
   return Agent(
     model=model,
     output_type=list[MindmapPathProposal],
     system_prompt=SYSTEM_PROMPT,
+    model_settings=prompt_cache_settings("mindmap_extractor", SYSTEM_PROMPT),
     deps_type=MindmapExtractorDeps,
     retries=2,
     defer_model_check=True,
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+import heapq
+import weakref
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 
 from pydantic_ai import Agent
 
-from meetinggenius.contracts import BoardState, CardKind, OrchestratorDecision, ToolingPolicy, TranscriptEvent
-
-MEETING_NATIVE_LIST_CARD_IDS = {
-  "list-decisions",
-  "list-actions",
-  "list-questions",
-  "list-risks",
-  "list-next-steps",
-}
-
-
-@dataclass(frozen=True)
+from meetinggenius.agents.prompt_cache import prompt_cache_settings
+from meetinggenius.contracts import (
+  BoardState,
+  CardKind,
+  OrchestratorDecision,
+  ToolingPolicy,
+  TranscriptEvent,
+)
+
+MEETING_NATIVE_LIST_CARD_IDS = frozenset(
+  {
+    "list-decisions",
+    "list-actions",
+    "list-questions",
+    "list-risks",
+    "list-next-steps",
+  }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class OrchestratorDeps:
   policy: ToolingPolicy
   default_location: str | None = None
@@ -140,11 +153,13 @@ Example B (headline request → task + list proposal)
 """.strip()
 
 
+@lru_cache(maxsize=8)
 def build_orchestrator_agent(model: str) -> Agent[OrchestratorDeps, OrchestratorDecision]:
   return Agent(
     model=model,
     output_type=OrchestratorDecision,
     system_prompt=SYSTEM_PROMPT,
+    model_settings=prompt_cache_settings("orchestrator", SYSTEM_PROMPT),
     deps_type=OrchestratorDeps,
     retries=2,
     defer_model_check=True,
@@ -152,11 +167,18 @@ def build_orchestrator_agent(model: str) -> Agent[OrchestratorDeps, Orchestrator
 
 
 def format_transcript_window(events: list[TranscriptEvent]) -> str:
-  lines: list[str] = []
-  for e in events:
-    who = f"{e.speaker}: " if e.speaker else ""
-    lines.append(f"- [{e.timestamp.isoformat()}] {who}{e.text}")
-  return "\n".join(lines)
+  return "\n".join(_format_transcript_line(e) for e in events)
+
+
+# Events are frozen (hashable), so each line is formatted once.
+@lru_cache(maxsize=4096)
+def _format_transcript_line(e: TranscriptEvent) -> str:
+  who = f"{e.speaker}: " if e.speaker else ""
+  return f"- [{e.timestamp.isoformat()}] {who}{e.text}"
+
+
+# Last summary, keyed by a weak reference to the BoardState it was built from.
+_summary_memo: tuple[weakref.ref[BoardState], tuple[int, int, int], str] | None = None
 
 
 def format_board_state_summary(
@@ -167,6 +189,29 @@ def format_board_state_summary(
   max_meeting_native_items: int = 25,
 ) -> str:
   """Summarize the current board so the model can update instead of duplicating cards."""
+  global _summary_memo
+  limits = (max_cards, max_dismissed, max_meeting_native_items)
+  memo = _summary_memo
+  if memo is not None and memo[0]() is state and memo[1] == limits:
+    return memo[2]
+
+  summary = _format_board_state_summary(
+    state,
+    max_cards=max_cards,
+    max_dismissed=max_dismissed,
+    max_meeting_native_items=max_meeting_native_items,
+  )
+  _summary_memo = (weakref.ref(state), limits, summary)
+  return summary
+
+
+def _format_board_state_summary(
+  state: BoardState,
+  *,
+  max_cards: int,
+  max_dismissed: int,
+  max_meeting_native_items: int,
+) -> str:
   if not state.cards and not state.dismissed:
     return "(empty board)"
 
@@ -174,48 +219,42 @@ def format_board_state_summary(
 
   if state.cards:
     lines.append("Existing cards (use update_card with card_id to modify these):")
-    items = list(state.cards.items())
-    items.sort(
-      key=lambda kv: (
-        str(getattr(kv[1], "kind", "")),
-        str(getattr(getattr(kv[1], "props", None), "title", "")),
-        kv[0],
-      )
-    )
-    for i, (card_id, card) in enumerate(items[:max_cards], start=1):
-      title = getattr(getattr(card, "props", None), "title", None) or ""
-      sources = getattr(card, "sources", None) or []
-      if getattr(card, "kind", None) == CardKind.CHART:
-        props = card.props  # type: ignore[attr-defined]
+    # Only the first `max_cards` are shown, so take a partial selection.
+    keyed = [(card.kind.value, card.props.title, card_id, card) for card_id, card in state.cards.items()]
+    shown = heapq.nsmallest(max_cards, keyed) if 0 <= max_cards < len(keyed) else sorted(keyed)[:max_cards]
+    for _, _, card_id, card in shown:
+      props = card.props
+      title = props.title
+      n_sources = len(card.sources)
+      if card.kind is CardKind.CHART:
         lines.append(
-          f"- {card_id} [chart] {title!r} (points={len(props.points)}, y_label={props.y_label!r}, sources={len(sources)})"
+          f"- {card_id} [chart] {title!r} (points={len(props.points)}, y_label={props.y_label!r}, sources={n_sources})"
         )
-      else:
-        props = card.props  # type: ignore[attr-defined]
-        lines.append(f"- {card_id} [list] {title!r} (items={len(props.items)}, sources={len(sources)})")
-        if card_id in MEETING_NATIVE_LIST_CARD_IDS and getattr(props, "items", None):
-          preview = list(props.items)[:max_meeting_native_items]
-          for item in preview:
-            text = getattr(item, "text", "") or ""
-            meta = getattr(item, "meta", None)
-            url = getattr(item, "url", None)
-            suffix_parts: list[str] = []
-            if meta:
-              suffix_parts.append(str(meta))
-            if url:
-              suffix_parts.append(str(url))
-            suffix = f" ({' | '.join(suffix_parts)})" if suffix_parts else ""
-            lines.append(f"  - {text}{suffix}")
-          if len(props.items) > len(preview):
-            lines.append("  - …")
-
-    remaining = len(items) - max_cards
+        continue
+
+      list_items = props.items
+      lines.append(f"- {card_id} [list] {title!r} (items={len(list_items)}, sources={n_sources})")
+      if card_id in MEETING_NATIVE_LIST_CARD_IDS and list_items:
+        for item in list_items[:max_meeting_native_items]:
+          meta = item.meta
+          url = item.url
+          if meta and url:
+            suffix = f" ({meta} | {url})"
+          elif meta or url:
+            suffix = f" ({meta or url})"
+          else:
+            suffix = ""
+          lines.append(f"  - {item.text}{suffix}")
+        if len(list_items) > max_meeting_native_items:
+          lines.append("  - …")
+
+    remaining = len(keyed) - max_cards
     if remaining > 0:
       lines.append(f"- …and {remaining} more cards not shown")
 
   if state.dismissed:
     lines.append("Dismissed cards (avoid recreating unless explicitly requested):")
-    dismissed_items = sorted(state.dismissed.items(), key=lambda kv: kv[0])
+    dismissed_items = sorted(state.dismissed.items(), key=itemgetter(0))
     for card_id, reason in dismissed_items[:max_dismissed]:
       reason_str = f" — {reason}" if reason else ""
       lines.append(f"- {card_id}{reason_str}")
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import hashlib
+
+from pydantic_ai.settings import ModelSettings
+
+
+def prompt_cache_settings(agent_name: str, system_prompt: str) -> ModelSettings:
+  # Every run of an agent starts with the same system prompt + output tool schema, so let providers
+  # serve that prefix from their prompt cache. Settings for other providers are ignored. Both keys are
+  # available in pydantic-ai-slim 1.37.0, the floor in pyproject.toml.
+  digest = hashlib.sha1(system_prompt.encode("utf-8")).hexdigest()[:12]
+  return ModelSettings(
+    # OpenAI caches long prefixes automatically; a stable key routes runs to the same cache.
+    openai_prompt_cache_key=f"meetinggenius:{agent_name}:{digest}",
+    # Anthropic needs an explicit breakpoint; tools come before the system prompt, so this covers both.
+    anthropic_cache_instructions=True,
+  )
@@ -1,69 +1,165 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any
+from typing import Any, Callable
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from meetinggenius.contracts import (
   BoardAction,
   BoardState,
   Card,
+  ChartCardProps,
+  ChartSeriesPoint,
   CreateCardAction,
   DismissCardAction,
+  ListCardProps,
+  ListItem,
   MoveCardAction,
   UpdateCardAction,
 )
 
 
 def apply_action(state: BoardState, action: BoardAction) -> BoardState:
-  next_state = deepcopy(state)
-
-  if isinstance(action, CreateCardAction):
-    card: Card = action.card
-    next_state.cards[card.card_id] = card
-    if action.rect is not None:
-      next_state.layout[card.card_id] = action.rect
-    next_state.dismissed.pop(card.card_id, None)
-    return next_state
-
-  if isinstance(action, UpdateCardAction):
-    existing = next_state.cards.get(action.card_id)
-    if existing is None:
-      return next_state
-
-    patched = _apply_patch(existing.model_dump(mode="python"), action.patch)
+  # Cards and rects are treated as immutable values: nothing mutates them in place, so the next
+  # state shares them with `state` and only the dicts an action changes are copied.
+  handler = _HANDLERS.get(action.type)
+  if handler is None:
+    return state
+  return handler(state, action)
+
+
+def _apply_create(state: BoardState, action: CreateCardAction) -> BoardState:
+  card: Card = action.card
+  if state.cards:
+    cards = dict(state.cards)
+    cards[card.card_id] = card
+  else:
+    # First card on an empty board: build the single-entry dict directly.
+    cards = {card.card_id: card}
+  update: dict[str, Any] = {"cards": cards}
+  if action.rect is not None:
+    if state.layout:
+      layout = dict(state.layout)
+      layout[card.card_id] = action.rect
+    else:
+      layout = {card.card_id: action.rect}
+    update["layout"] = layout
+  if card.card_id in state.dismissed:
+    dismissed = dict(state.dismissed)
+    del dismissed[card.card_id]
+    update["dismissed"] = dismissed
+  return state.model_copy(update=update)
+
+
+def _apply_update(state: BoardState, action: UpdateCardAction) -> BoardState:
+  existing = state.cards.get(action.card_id)
+  if existing is None or not action.patch:
+    return state
+
+  updated = _copy_with_patch(existing, action.patch)
+  if updated is None:
+    dumped = existing.model_dump(mode="python")
+    patched = _apply_patch(dumped, action.patch)
+    if patched == dumped:
+      # The planner often re-proposes content the card already has; skip re-validation.
+      return state
     try:
       updated = existing.__class__.model_validate(patched)
     except ValidationError:
       sanitized = _sanitize_card_dict(patched)
       if sanitized is patched:
-        return next_state
+        return state
       try:
         updated = existing.__class__.model_validate(sanitized)
       except ValidationError:
-        return next_state
-    next_state.cards[action.card_id] = updated
-    return next_state
-
-  if isinstance(action, MoveCardAction):
-    if action.card_id in next_state.cards:
-      next_state.layout[action.card_id] = action.rect
-    return next_state
-
-  if isinstance(action, DismissCardAction):
-    next_state.cards.pop(action.card_id, None)
-    next_state.layout.pop(action.card_id, None)
-    next_state.dismissed[action.card_id] = action.reason or ""
-    return next_state
-
-  return next_state
+        return state
+  if updated is existing:
+    return state
+  cards = dict(state.cards)
+  cards[action.card_id] = updated
+  return state.model_copy(update={"cards": cards})
+
+
+def _apply_move(state: BoardState, action: MoveCardAction) -> BoardState:
+  if action.card_id not in state.cards:
+    return state
+  layout = dict(state.layout)
+  layout[action.card_id] = action.rect
+  return state.model_copy(update={"layout": layout})
+
+
+def _apply_dismiss(state: BoardState, action: DismissCardAction) -> BoardState:
+  cards = dict(state.cards)
+  cards.pop(action.card_id, None)
+  layout = dict(state.layout)
+  layout.pop(action.card_id, None)
+  dismissed = dict(state.dismissed)
+  dismissed[action.card_id] = action.reason or ""
+  return state.model_copy(update={"cards": cards, "layout": layout, "dismissed": dismissed})
+
+
+# Dispatch on the action's `type` literal (one dict lookup) instead of an isinstance cascade.
+_HANDLERS: dict[str, Callable[[BoardState, Any], BoardState]] = {
+  "create_card": _apply_create,
+  "update_card": _apply_update,
+  "move_card": _apply_move,
+  "dismiss_card": _apply_dismiss,
+}
+
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+# List fields whose patches are validated item by item, so replacing a list card's items or a
+# chart's points never dumps and re-validates the rest of the card.
+_LIST_ITEM_MODELS: dict[tuple[type[BaseModel], str], type[BaseModel]] = {
+  (ListCardProps, "items"): ListItem,
+  (ChartCardProps, "points"): ChartSeriesPoint,
+}
+
+
+def _copy_with_patch(model: BaseModel, patch: dict[str, Any]) -> BaseModel | None:
+  # Fast path for the common planner patches (titles, labels, nested props scalars): when every
+  # patched value is a scalar of the same type as the field it replaces, the result is already
+  # valid, so skip the dump + re-validate round trip. Returns None when validation is needed, and
+  # `model` itself when the patch changes nothing.
+  update: dict[str, Any] = {}
+  for key, value in patch.items():
+    if key not in type(model).model_fields:
+      return None
+    current = getattr(model, key)
+    if isinstance(value, dict) and isinstance(current, BaseModel):
+      nested = _copy_with_patch(current, value)
+      if nested is None:
+        return None
+      if nested is not current:
+        update[key] = nested
+    elif type(value) is type(current) and type(value) in _SCALAR_TYPES:
+      if value != current:
+        update[key] = value
+    elif type(value) is list and (item_model := _LIST_ITEM_MODELS.get((type(model), key))) is not None:
+      try:
+        update[key] = [x if isinstance(x, item_model) else item_model.model_validate(x) for x in value]
+      except ValidationError:
+        # Let the full path sanitize (e.g. drop blank item urls) and retry.
+        return None
+    else:
+      return None
+  if not update:
+    return model
+  return model.model_copy(update=update)
 
 
 def _apply_patch(obj: Any, patch: dict[str, Any]) -> Any:
-  if not isinstance(obj, dict):
+  if not isinstance(obj, dict) or not patch:
     return obj
 
+  for key, value in patch.items():
+    if isinstance(value, dict) and isinstance(obj.get(key), dict):
+      break
+  else:
+    # Nothing to merge recursively: a plain dict union does the copy + overwrite in one call.
+    return obj | patch
+
   result = dict(obj)
   for key, value in patch.items():
     if isinstance(value, dict) and isinstance(result.get(key), dict):
@@ -8,7 +8,15 @@ from datetime import UTC, datetime
 from dotenv import load_dotenv
 
 from meetinggenius.board.reducer import apply_action
-from meetinggenius.contracts import BoardState, ToolingPolicy, TranscriptEvent
+from meetinggenius.contracts import (
+  EMPTY_BOARD_STATE,
+  BoardAction,
+  BoardState,
+  ResearchResult,
+  ResearchTask,
+  ToolingPolicy,
+  TranscriptEvent,
+)
 from meetinggenius.task_seeding import auto_seed_research_tasks
 from meetinggenius.tools.research import run_research_task
 
@@ -32,18 +40,17 @@ def main() -> None:
 
 async def _simulate(text: str, *, default_location: str, no_browse: bool) -> None:
   try:
-    from meetinggenius.agents.board_planner import BoardPlannerDeps, build_board_planner_agent
-    from meetinggenius.agents.orchestrator import (
-      OrchestratorDeps,
-      build_orchestrator_agent,
-      format_transcript_window,
+    from meetinggenius.agents.combined_planner import (
+      CombinedPlannerDeps,
+      build_combined_planner_agent,
     )
+    from meetinggenius.agents.orchestrator import format_transcript_window
   except ModuleNotFoundError as e:
     raise ModuleNotFoundError("Missing dependencies; run: `python -m pip install -e .`") from e
 
   model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
   policy = ToolingPolicy(no_browse=no_browse)
-  board_state = BoardState.empty()
+  board_state = EMPTY_BOARD_STATE
 
   transcript = [
     TranscriptEvent(
@@ -54,22 +61,95 @@ async def _simulate(text: str, *, default_location: str, no_browse: bool) -> Non
     )
   ]
 
+  user_prompt = format_transcript_window(transcript)
+  if no_browse:
+    # Every research tool needs browsing, so the planner could only ever see empty research results:
+    # let one agent call produce both the decision and the actions.
+    combined = build_combined_planner_agent(model)
+    combined_deps = CombinedPlannerDeps(policy=policy, default_location=default_location, board_state=board_state)
+    actions = (await combined.run(user_prompt, deps=combined_deps)).output.actions
+  else:
+    actions = await _orchestrate_and_plan(
+      text,
+      user_prompt,
+      model=model,
+      policy=policy,
+      default_location=default_location,
+      board_state=board_state,
+    )
+
+  for a in actions:
+    board_state = apply_action(board_state, a)
+
+  print("BoardActions:")
+  for a in actions:
+    print(a.model_dump(mode="json"))
+  print("\nBoardState cards:", list(board_state.cards.keys()))
+
+
+async def _orchestrate_and_plan(
+  text: str,
+  user_prompt: str,
+  *,
+  model: str,
+  policy: ToolingPolicy,
+  default_location: str,
+  board_state: BoardState,
+) -> list[BoardAction]:
+  from meetinggenius.agents.board_planner import BoardPlannerDeps, build_board_planner_agent
+  from meetinggenius.agents.orchestrator import OrchestratorDeps, build_orchestrator_agent
+
   orchestrator = build_orchestrator_agent(model)
   deps = OrchestratorDeps(policy=policy, default_location=default_location, board_state=board_state)
-  user_prompt = format_transcript_window(transcript)
-  decision = orchestrator.run_sync(user_prompt, deps=deps).output
 
-  tasks = decision.research_tasks
-  if not tasks:
-    tasks = auto_seed_research_tasks(text, default_location=default_location)
+  # Research tasks start as soon as the streamed decision contains them, so tool calls overlap with
+  # the rest of the orchestrator's output instead of waiting for it.
+  running: list[tuple[ResearchTask, asyncio.Task[ResearchResult]]] = []
+
+  def launch(tasks: list[ResearchTask]) -> None:
+    for i, t in enumerate(tasks):
+      if i < len(running):
+        if running[i][0] == t:
+          continue
+        # The model changed an earlier task (e.g. after an output retry); restart it.
+        running[i][1].cancel()
+        running[i] = (t, asyncio.create_task(run_research_task(t, no_browse=policy.no_browse)))
+      else:
+        running.append((t, asyncio.create_task(run_research_task(t, no_browse=policy.no_browse))))
+    for _, stale in running[len(tasks) :]:
+      stale.cancel()
+    del running[len(tasks) :]
+
+  try:
+    async with orchestrator.run_stream(user_prompt, deps=deps) as stream:
+      async for partial in stream.stream_output():
+        # The last task may still be mid-stream; every task before it is complete.
+        launch(partial.research_tasks[:-1])
+      decision = await stream.get_output()
+
+    tasks = decision.research_tasks
+    if not tasks:
+      tasks = auto_seed_research_tasks(text, default_location=default_location)
+    launch(tasks)
+
+    outcomes = await asyncio.gather(*(task for _, task in running), return_exceptions=True)
+  except BaseException:
+    # The orchestrator failed (or we were interrupted) with research still in flight; don't leave it
+    # running in the background.
+    for _, task in running:
+      task.cancel()
+    await asyncio.gather(*(task for _, task in running), return_exceptions=True)
+    raise
 
   results = []
-  for t in tasks:
-    try:
-      results.append(await run_research_task(t, no_browse=no_browse))
-    except Exception as e:
+  for (t, _), outcome in zip(running, outcomes):
+    if isinstance(outcome, Exception):
       label = t.tool_name or t.kind
-      print(f"[research:{label}] failed: {e}")
+      print(f"[research:{label}] failed: {outcome}")
+    elif isinstance(outcome, BaseException):
+      raise outcome
+    else:
+      results.append(outcome)
 
   planner = build_board_planner_agent(model)
   planner_deps = BoardPlannerDeps(
@@ -78,12 +158,4 @@ async def _simulate(text: str, *, default_location: str, no_browse: bool) -> Non
     orchestrator_decision=decision,
     research_results=results,
   )
-  actions = planner.run_sync("Generate board actions for the current meeting context.", deps=planner_deps).output
-
-  for a in actions:
-    board_state = apply_action(board_state, a)
-
-  print("BoardActions:")
-  for a in actions:
-    print(a.model_dump(mode="json"))
-  print("\nBoardState cards:", list(board_state.cards.keys()))
+  return (await planner.run("Generate board actions for the current meeting context.", deps=planner_deps)).output
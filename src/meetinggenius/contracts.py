@@ -5,11 +5,39 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import Annotated, Any, Literal, Union
 
-from pydantic import AnyUrl, BaseModel, ConfigDict, Field, model_validator
+from pydantic import (
+  AnyUrl,
+  BaseModel,
+  ConfigDict,
+  Field,
+  PlainValidator,
+  TypeAdapter,
+  WithJsonSchema,
+  model_validator,
+)
 
+_ANY_URL_ADAPTER = TypeAdapter(AnyUrl)
+
+
+class _ValidatedUrl(str):
+  __slots__ = ()
+
+
+def _validate_url(value: Any) -> str:
+  # Already-parsed URLs (e.g. from dumped cards) skip the AnyUrl parser.
+  if type(value) is _ValidatedUrl:
+    return value
+  return _ValidatedUrl(_ANY_URL_ADAPTER.validate_python(value))
+
+
+UrlStr = Annotated[
+  str,
+  PlainValidator(_validate_url),
+  WithJsonSchema({"type": "string", "format": "uri", "minLength": 1}),
+]
 
 class TranscriptEvent(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
   event_id: str | None = None
@@ -20,9 +48,9 @@ class TranscriptEvent(BaseModel):
 
 
 class Citation(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
-  url: AnyUrl
+  url: UrlStr
   title: str | None = None
   retrieved_at: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
   published_at: datetime | None = None
@@ -34,7 +62,7 @@ class ResearchKind(str, Enum):
 
 
 class WeatherPoint(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True, allow_inf_nan=False)
 
   year: int = Field(ge=1900, le=3000)
   avg_temp_c: float
@@ -53,7 +81,7 @@ class HeadlineItem(BaseModel):
   model_config = ConfigDict(extra="forbid")
 
   title: str
-  url: AnyUrl
+  url: UrlStr
   published_at: datetime | None = None
   source: str | None = None
 
@@ -131,14 +159,14 @@ class CardKind(str, Enum):
 
 
 class ChartSeriesPoint(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True, allow_inf_nan=False)
 
   label: str
   value: float
 
 
 class ChartCardProps(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   title: str
   subtitle: str | None = None
@@ -148,22 +176,22 @@ class ChartCardProps(BaseModel):
 
 
 class ListItem(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   text: str
-  url: AnyUrl | None = None
+  url: UrlStr | None = None
   meta: str | None = None
 
 
 class ListCardProps(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   title: str
   items: list[ListItem]
 
 
 class ChartCard(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   card_id: str
   kind: Literal[CardKind.CHART]
@@ -172,7 +200,7 @@ class ChartCard(BaseModel):
 
 
 class ListCard(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   card_id: str
   kind: Literal[CardKind.LIST]
@@ -183,8 +211,9 @@ class ListCard(BaseModel):
 Card = Annotated[Union[ChartCard, ListCard], Field(discriminator="kind")]
 
 
+# JSON has no NaN/Infinity, so coordinates and values must be finite.
 class Rect(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True, allow_inf_nan=False)
 
   x: float
   y: float
@@ -259,8 +288,9 @@ class OrchestratorDecision(BaseModel):
   assumptions: dict[str, Any] = Field(default_factory=dict)
 
 
+# Board/mindmap states are replaced, never mutated, so they are shared and compared by identity.
 class BoardState(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   cards: dict[str, Card] = Field(default_factory=dict)
   layout: dict[str, Rect] = Field(default_factory=dict)
@@ -271,15 +301,18 @@ class BoardState(BaseModel):
     return cls()
 
 
+EMPTY_BOARD_STATE = BoardState()
+
+
 class MindmapPoint(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True, allow_inf_nan=False)
 
   x: float
   y: float
 
 
 class MindmapNode(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   node_id: str
   parent_id: str | None = None
@@ -289,7 +322,7 @@ class MindmapNode(BaseModel):
 
 
 class MindmapState(BaseModel):
-  model_config = ConfigDict(extra="forbid")
+  model_config = ConfigDict(extra="forbid", frozen=True)
 
   root_id: str = "mm:root"
   nodes: dict[str, MindmapNode] = Field(default_factory=dict)
@@ -359,7 +392,7 @@ MindmapAction = Annotated[
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolingPolicy:
   no_browse: bool = False
   max_cards_per_minute: int = 2
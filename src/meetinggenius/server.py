@@ -7,12 +7,14 @@ import os
 import re
 import time
 import traceback
-from collections import deque
+import weakref
+from collections import Counter, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from pydantic import TypeAdapter, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 try:
   from dotenv import load_dotenv
@@ -23,9 +25,16 @@ except Exception:
   # Ignore failures so production/container env behaves normally.
   pass
 
+try:
+  import orjson
+except ModuleNotFoundError:
+  # Optional speedup; fall back to the stdlib json module.
+  orjson = None
+
 from meetinggenius.board.reducer import apply_action
 from meetinggenius.agents.orchestrator import MEETING_NATIVE_LIST_CARD_IDS
 from meetinggenius.contracts import (
+  EMPTY_BOARD_STATE,
   BoardAction,
   BoardState,
   CardKind,
@@ -71,6 +80,23 @@ app = FastAPI(title="MeetingGenius Realtime Backend")
 PERSIST_STORE: SQLiteKVStore | None = None
 PERSISTOR: DebouncedStatePersister | None = None
 
+_BOARD_ACTION_ADAPTER: TypeAdapter[BoardAction] = TypeAdapter(BoardAction)
+_MINDMAP_ACTION_ADAPTER: TypeAdapter[MindmapAction] = TypeAdapter(MindmapAction)
+_BOARD_ACTIONS_ADAPTER: TypeAdapter[list[BoardAction]] = TypeAdapter(list[BoardAction])
+_MINDMAP_ACTIONS_ADAPTER: TypeAdapter[list[MindmapAction]] = TypeAdapter(list[MindmapAction])
+
+# Action types clients may send directly; everything else comes from the AI runners.
+CLIENT_BOARD_ACTION_TYPES: tuple[str, ...] = ("move_card", "dismiss_card")
+CLIENT_MINDMAP_ACTION_TYPES: tuple[str, ...] = (
+  "set_node_pos",
+  "set_collapsed",
+  "rename_node",
+  "reparent_node",
+  "delete_subtree",
+)
+_CLIENT_BOARD_ACTION_TYPE_SET = frozenset(CLIENT_BOARD_ACTION_TYPES)
+_CLIENT_MINDMAP_ACTION_TYPE_SET = frozenset(CLIENT_MINDMAP_ACTION_TYPES)
+
 MEETING_NATIVE_BASE_LIST_CARDS: tuple[tuple[str, str], ...] = (
   ("list-decisions", "Decisions"),
   ("list-actions", "Action Items"),
@@ -88,6 +114,7 @@ MEETING_NATIVE_MINDMAP_CATEGORIES: tuple[tuple[str, str, str], ...] = (
   ("mm:risks", "Risks / Blockers", "list-risks"),
   ("mm:next-steps", "Next Steps", "list-next-steps"),
 )
+MEETING_NATIVE_MINDMAP_CATEGORY_IDS = frozenset(node_id for node_id, _, _ in MEETING_NATIVE_MINDMAP_CATEGORIES)
 
 
 def _meeting_native_seed_rect(index: int) -> Rect:
@@ -138,40 +165,56 @@ def _meeting_native_seed_actions(board_state: BoardState, actions: list[BoardAct
   return seeded
 
 
+_LIST_ITEM_BULLET_CHARS = frozenset("-*\u2022).")
+
+
+@lru_cache(maxsize=8192)
 def _normalize_list_item_text(value: str) -> str:
   cleaned = value.strip().lower()
-  cleaned = re.sub(r"^[\s\-\*\u2022\d\)\.]+", "", cleaned)
-  cleaned = re.sub(r"\s+", " ", cleaned).strip()
+  # Skip leading bullets / numbering ("- ", "1) ", "2. ").
+  start = 0
+  while start < len(cleaned) and (
+    cleaned[start] in _LIST_ITEM_BULLET_CHARS or cleaned[start].isspace() or cleaned[start].isdecimal()
+  ):
+    start += 1
+  cleaned = " ".join(cleaned[start:].split())
   cleaned = cleaned.strip(" \t\r\n.;")
   return cleaned
 
 
+# The named group that matched picks the card; `[^\S\n]` keeps a match on one line.
+_MEETING_NATIVE_LINE_RE = re.compile(
+  r"^[^\S\n]*(?:"
+  r"(?P<decisions>decision|decisions)"
+  r"|(?P<actions>action item|action items|action)"
+  r"|(?P<questions>open question|open questions|question|questions)"
+  r"|(?P<risks>risk|risks|blocker|blockers|risk[^\S\n]*/[^\S\n]*blocker)"
+  r"|(?P<next_steps>next step|next steps)"
+  r")[^\S\n]*[:\-–][^\S\n]*(?P<item>.+)$",
+  re.IGNORECASE | re.MULTILINE,
+)
+_MEETING_NATIVE_LINE_GROUPS: tuple[tuple[str, str], ...] = (
+  ("decisions", "list-decisions"),
+  ("actions", "list-actions"),
+  ("questions", "list-questions"),
+  ("risks", "list-risks"),
+  ("next_steps", "list-next-steps"),
+)
+# Line boundaries `str.splitlines` honours besides "\n"; `^`/`$` only know "\n".
+_EXTRA_LINE_BREAKS = str.maketrans(dict.fromkeys("\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029", "\n"))
+
+
 def _extract_meeting_native_items(events: list[TranscriptEvent]) -> dict[str, list[str]]:
   buckets: dict[str, list[str]] = {card_id: [] for card_id, _ in MEETING_NATIVE_BASE_LIST_CARDS}
 
-  patterns: list[tuple[str, re.Pattern[str]]] = [
-    ("list-decisions", re.compile(r"^\s*(?:decision|decisions)\s*[:\-–]\s*(.+)$", re.IGNORECASE)),
-    ("list-actions", re.compile(r"^\s*(?:action item|action items|action)\s*[:\-–]\s*(.+)$", re.IGNORECASE)),
-    ("list-questions", re.compile(r"^\s*(?:open question|open questions|question|questions)\s*[:\-–]\s*(.+)$", re.IGNORECASE)),
-    ("list-risks", re.compile(r"^\s*(?:risk|risks|blocker|blockers|risk\s*/\s*blocker)\s*[:\-–]\s*(.+)$", re.IGNORECASE)),
-    ("list-next-steps", re.compile(r"^\s*(?:next step|next steps)\s*[:\-–]\s*(.+)$", re.IGNORECASE)),
-  ]
-
-  for event in events:
-    text = event.text or ""
-    if not text.strip():
+  blob = "\n".join(event.text for event in events if event.text).translate(_EXTRA_LINE_BREAKS)
+  for match in _MEETING_NATIVE_LINE_RE.finditer(blob):
+    item = match.group("item").strip()
+    if not item:
       continue
-    for raw_line in text.splitlines():
-      line = raw_line.strip()
-      if not line:
-        continue
-      for card_id, pattern in patterns:
-        match = pattern.match(line)
-        if not match:
-          continue
-        item = match.group(1).strip()
-        if item:
-          buckets[card_id].append(item)
+    for group, card_id in _MEETING_NATIVE_LINE_GROUPS:
+      if match.group(group) is not None:
+        buckets[card_id].append(item)
         break
 
   return {card_id: items for card_id, items in buckets.items() if items}
@@ -198,7 +241,7 @@ def _meeting_native_update_actions(
 
     existing_items: list[ListItem] = list(getattr(getattr(existing, "props", None), "items", []) or [])
     existing_norm = {_normalize_list_item_text(i.text) for i in existing_items if getattr(i, "text", None)}
-    next_items = [i.model_dump(mode="python") for i in existing_items]
+    next_items = [{"text": i.text, "url": i.url, "meta": i.meta} for i in existing_items]
 
     added = 0
     for raw in items:
@@ -207,7 +250,7 @@ def _meeting_native_update_actions(
       normalized = _normalize_list_item_text(raw)
       if not normalized or normalized in existing_norm:
         continue
-      next_items.append(ListItem(text=raw.strip()).model_dump(mode="python"))
+      next_items.append({"text": raw.strip(), "url": None, "meta": None})
       existing_norm.add(normalized)
       added += 1
       remaining -= 1
@@ -280,6 +323,13 @@ def _meeting_native_create_or_update_actions(
   return actions, next_state
 
 
+def _apply_board_actions(state: BoardState, actions: list[BoardAction]) -> BoardState:
+  for action in actions:
+    state = apply_action(state, action)
+  return state
+
+
+@lru_cache(maxsize=8192)
 def _mindmap_normalize_text(value: str) -> str:
   cleaned = value.strip().lower()
   cleaned = re.sub(r"\s+", " ", cleaned).strip()
@@ -317,31 +367,43 @@ def _mindmap_route_reserved_segment(text: str) -> str | None:
   return _MINDMAP_RESERVED_SEGMENTS.get(key)
 
 
+@lru_cache(maxsize=8192)
+def _mindmap_id_digest(parent_id: str, normalized: str) -> str:
+  # Node ids are persisted, so the digest must stay stable across versions.
+  return hashlib.sha1(f"{parent_id}\n{normalized}".encode("utf-8")).hexdigest()[:12]
+
+
 def _mindmap_leaf_id(parent_id: str, text: str) -> str:
-  normalized = _mindmap_normalize_text(text)
-  digest = hashlib.sha1(f"{parent_id}\n{normalized}".encode("utf-8")).hexdigest()[:12]
-  return f"mm:item:{digest}"
+  return f"mm:item:{_mindmap_id_digest(parent_id, _mindmap_normalize_text(text))}"
 
 
 def _mindmap_path_id(parent_id: str, text: str) -> str:
-  normalized = _mindmap_normalize_text(text)
-  digest = hashlib.sha1(f"{parent_id}\n{normalized}".encode("utf-8")).hexdigest()[:12]
-  return f"mm:path:{digest}"
+  return f"mm:path:{_mindmap_id_digest(parent_id, _mindmap_normalize_text(text))}"
 
 
-def _mindmap_find_child_by_text(state: MindmapState, *, parent_id: str, text: str) -> str | None:
+def _mindmap_find_child_by_text(
+  state: MindmapState, *, parent_id: str, text: str, index: _MindmapIndex | None = None
+) -> str | None:
   wanted = _mindmap_normalize_text(text)
   if not wanted:
     return None
+  if index is not None:
+    exact_id = index.child_with_text(parent_id, wanted)
+    if exact_id is not None:
+      return exact_id
+  title_norm = _normalize_title(text)
   best_id: str | None = None
   best_score = 0.0
-  for node_id, node in state.nodes.items():
+  candidate_ids = state.nodes if index is None else index.children(parent_id)
+  for node_id in candidate_ids:
+    node = state.nodes[node_id]
     if node.parent_id != parent_id:
       continue
     if _mindmap_normalize_text(node.text) == wanted:
       return node_id
-    if _very_similar_title(node.text, text):
-      score = _title_similarity(node.text, text)
+    node_norm = _normalize_title(node.text)
+    if _very_similar_normalized_titles(node_norm, title_norm):
+      score = _normalized_title_similarity(node_norm, title_norm)
       if score > best_score:
         best_id = node_id
         best_score = score
@@ -367,25 +429,93 @@ def _mindmap_find_any_node_by_exact_text(state: MindmapState, text: str) -> str
   return None
 
 
-def _mindmap_find_any_node_by_similar_text(state: MindmapState, text: str) -> str | None:
+class _MindmapIndex:
+  # Lookup tables for a run of proposal lookups, updated as nodes are upserted. Results come back in
+  # `state.nodes` order, so ties resolve to the same node as a full scan.
+  def __init__(self, state: MindmapState) -> None:
+    self._order: dict[str, int] = {}
+    self._placement: dict[str, tuple[str | None, str]] = {}
+    self._children: dict[str | None, set[str]] = {}
+    self._by_parent_text: dict[tuple[str | None, str], set[str]] = {}
+    self._tokens: dict[str, frozenset[str]] = {}
+    self._by_token: dict[str, set[str]] = {}
+    self._long_titles: dict[str, str] = {}
+    for node in state.nodes.values():
+      self.add(node)
+
+  def add(self, node: MindmapNode) -> None:
+    node_id = node.node_id
+    self._order.setdefault(node_id, len(self._order))
+
+    previous = self._placement.get(node_id)
+    if previous is not None:
+      self._children[previous[0]].discard(node_id)
+      self._by_parent_text[previous].discard(node_id)
+    placement = (node.parent_id, _mindmap_normalize_text(node.text))
+    self._placement[node_id] = placement
+    self._children.setdefault(node.parent_id, set()).add(node_id)
+    self._by_parent_text.setdefault(placement, set()).add(node_id)
+
+    for token in self._tokens.get(node_id, ()):
+      self._by_token[token].discard(node_id)
+    normalized = _normalize_title(node.text)
+    tokens = _title_tokens(normalized)
+    self._tokens[node_id] = tokens
+    for token in tokens:
+      self._by_token.setdefault(token, set()).add(node_id)
+    if len(normalized) >= 12:
+      self._long_titles[node_id] = normalized
+    else:
+      self._long_titles.pop(node_id, None)
+
+  def child_with_text(self, parent_id: str, normalized: str) -> str | None:
+    found = self._by_parent_text.get((parent_id, normalized))
+    return min(found, key=self._order.__getitem__) if found else None
+
+  def children(self, parent_id: str) -> list[str]:
+    return sorted(self._children.get(parent_id, ()), key=self._order.__getitem__)
+
+  def similar_candidates(self, text: str) -> list[str]:
+    normalized = _normalize_title(text)
+    if not normalized:
+      return []
+    found: set[str] = set()
+    for token in _title_tokens(normalized):
+      found.update(self._by_token.get(token, ()))
+    if len(normalized) >= 12:
+      found.update(
+        node_id
+        for node_id, title in self._long_titles.items()
+        if node_id not in found and (title in normalized or normalized in title)
+      )
+    return sorted(found, key=self._order.__getitem__)
+
+
+def _mindmap_find_any_node_by_similar_text(
+  state: MindmapState, text: str, *, index: _MindmapIndex | None = None
+) -> str | None:
   wanted = _mindmap_normalize_text(text)
   if not wanted:
     return None
 
+  title_norm = _normalize_title(text)
   similarity_threshold = 0.88
-  category_ids = {node_id for node_id, _, _ in MEETING_NATIVE_MINDMAP_CATEGORIES}
+  category_ids = MEETING_NATIVE_MINDMAP_CATEGORY_IDS
   best_id: str | None = None
   best_score = 0.0
 
-  for node_id, node in state.nodes.items():
+  candidate_ids = state.nodes if index is None else index.similar_candidates(text)
+  for node_id in candidate_ids:
+    node = state.nodes[node_id]
     if node_id == state.root_id:
       continue
 
     if node_id in category_ids and _mindmap_normalize_text(node.text) != wanted:
       continue
 
-    score = _title_similarity(node.text, text)
-    is_similar = _very_similar_title(node.text, text)
+    node_norm = _normalize_title(node.text)
+    score = _normalized_title_similarity(node_norm, title_norm)
+    is_similar = _very_similar_normalized_titles(node_norm, title_norm)
     if score < similarity_threshold and not is_similar:
       continue
     if is_similar:
@@ -481,16 +611,20 @@ def _mindmap_extractor_mode() -> str:
   return "ai"
 
 
+# Optional "[12:34]" timestamp, then an optional "Speaker: " prefix.
+_STUB_LINE_PREFIX_RE = re.compile(r"^\s*(?:\[\d{2}:\d{2}\]\s*)?(?:[A-Za-z][A-Za-z0-9 .'-]{0,32}:\s+(?=\S))?")
+_STUB_LINE_SPLIT_RE = re.compile(r"\n+")
+_STUB_SENTENCE_SPLIT_RE = re.compile(r"[.!?]\s+")
+
+
 def _stub_strip_timestamp_and_speaker(text: str) -> str:
-  cleaned = re.sub(r"^\s*\[\d{2}:\d{2}\]\s*", "", text).strip()
-  cleaned = re.sub(r"^[A-Za-z][A-Za-z0-9 .'-]{0,32}:\s+", "", cleaned)
-  return cleaned.strip()
+  return text[_STUB_LINE_PREFIX_RE.match(text).end() :].strip()
 
 
 def _stub_sentence_candidates(text: str) -> list[str]:
   text = text.replace("\r", "\n")
   sentences: list[str] = []
-  for raw_line in re.split(r"\n+", text):
+  for raw_line in _STUB_LINE_SPLIT_RE.split(text):
     line = raw_line.strip()
     if not line:
       continue
@@ -498,7 +632,7 @@ def _stub_sentence_candidates(text: str) -> list[str]:
     if not line:
       continue
     line = line.replace("\u2014", ". ")
-    for part in re.split(r"[.!?]\s+", line):
+    for part in _STUB_SENTENCE_SPLIT_RE.split(line):
       part = part.strip()
       if not part:
         continue
@@ -509,29 +643,30 @@ def _stub_sentence_candidates(text: str) -> list[str]:
   return sentences
 
 
+_STUB_PHRASE_STRIP = " ,.;:()[]"
+_STUB_PHRASE_WORDS = 3
+_STUB_MAX_PHRASES = 6
+
+
 def _stub_phrase_candidates(sentence: str) -> list[str]:
   cleaned = sentence.strip().strip("\"'`")
-  cleaned = cleaned.strip(" ,.;:()[]")
+  cleaned = cleaned.strip(_STUB_PHRASE_STRIP)
   if ":" in cleaned:
     prefix, rest = cleaned.split(":", 1)
     if len(prefix.split()) <= 3:
       cleaned = rest.strip()
-  tokens = [t for t in cleaned.split() if t]
+  tokens = cleaned.split()
   if not tokens:
     return []
-  max_words = 3
-  min_words = 3
-  phrases: list[str] = []
-  for idx in range(0, len(tokens), max_words):
-    chunk = tokens[idx : idx + max_words]
-    if len(chunk) < min_words:
-      continue
-    phrases.append(" ".join(chunk))
-    if len(phrases) >= 6:
-      break
-  if not phrases:
-    phrases.append(" ".join(tokens[:8]))
-  return [p.strip(" ,.;:()[]") for p in phrases if p.strip(" ,.;:()[]")]
+  full_chunks = min(len(tokens) // _STUB_PHRASE_WORDS, _STUB_MAX_PHRASES)
+  if full_chunks:
+    phrases = [
+      " ".join(tokens[idx : idx + _STUB_PHRASE_WORDS])
+      for idx in range(0, full_chunks * _STUB_PHRASE_WORDS, _STUB_PHRASE_WORDS)
+    ]
+  else:
+    phrases = [" ".join(tokens[:8])]
+  return [stripped for phrase in phrases if (stripped := phrase.strip(_STUB_PHRASE_STRIP))]
 
 
 def _stub_mindmap_path_proposals(
@@ -592,22 +727,19 @@ def _format_mindmap_state_summary(state: MindmapState, *, max_nodes: int = 60, m
   lines: list[str] = []
   count = 0
 
-  def visit(node_id: str, depth: int) -> None:
-    nonlocal count
-    if count >= max_nodes:
-      return
+  stack: list[tuple[str, int]] = [(state.root_id, 0)]
+  while stack and count < max_nodes:
+    node_id, depth = stack.pop()
     node = nodes.get(node_id)
     if node is None:
-      return
-    prefix = "  " * depth
-    lines.append(f"{prefix}- {node.text}")
+      continue
+    lines.append(f"{'  ' * depth}- {node.text}")
     count += 1
     if node.collapsed:
-      return
-    for child in children_by_parent.get(node_id, [])[:max_children]:
-      visit(child.node_id, depth + 1)
+      continue
+    for child in reversed(children_by_parent.get(node_id, [])[:max_children]):
+      stack.append((child.node_id, depth + 1))
 
-  visit(state.root_id, 0)
   remaining = len(nodes) - count
   if remaining > 0:
     lines.append(f"- …and {remaining} more node(s)")
@@ -626,6 +758,24 @@ def _mindmap_root_pos() -> MindmapPoint:
   return MindmapPoint(x=40.0, y=40.0)
 
 
+def _mindmap_descendant_ids(state: MindmapState, node_id: str) -> list[str]:
+  children: dict[str, list[str]] = {}
+  for nid, n in state.nodes.items():
+    if n.parent_id is not None:
+      children.setdefault(n.parent_id, []).append(nid)
+
+  descendants: list[str] = []
+  seen: set[str] = set()
+  stack = [node_id]
+  while stack:
+    for child_id in children.get(stack.pop(), ()):
+      if child_id not in seen:
+        seen.add(child_id)
+        descendants.append(child_id)
+        stack.append(child_id)
+  return descendants
+
+
 def _apply_mindmap_action(state: MindmapState, action: MindmapAction) -> MindmapState:
   if isinstance(action, UpsertMindmapNodeAction):
     nodes = dict(state.nodes)
@@ -659,15 +809,7 @@ def _apply_mindmap_action(state: MindmapState, action: MindmapAction) -> Mindmap
 
     nodes = dict(state.nodes)
     layout = dict(state.layout)
-    to_delete: list[str] = [action.node_id]
-
-    idx = 0
-    while idx < len(to_delete):
-      current = to_delete[idx]
-      idx += 1
-      for node_id, node in list(nodes.items()):
-        if node.parent_id == current:
-          to_delete.append(node_id)
+    to_delete = [action.node_id, *_mindmap_descendant_ids(state, action.node_id)]
 
     for node_id in to_delete:
       nodes.pop(node_id, None)
@@ -684,17 +826,15 @@ def _apply_mindmap_action(state: MindmapState, action: MindmapAction) -> Mindmap
     if action.new_parent_id is not None and action.new_parent_id not in state.nodes:
       return state
 
-    # Prevent cycles by disallowing reparenting under a descendant.
-    descendant_ids: set[str] = set()
-    queue = [action.node_id]
-    while queue:
-      cur = queue.pop()
-      for nid, n in state.nodes.items():
-        if n.parent_id == cur and nid not in descendant_ids:
-          descendant_ids.add(nid)
-          queue.append(nid)
-    if action.new_parent_id in descendant_ids:
-      return state
+    # Prevent cycles by disallowing reparenting under the node itself or a descendant.
+    ancestor_id = action.new_parent_id
+    seen: set[str] = set()
+    while ancestor_id is not None and ancestor_id not in seen:
+      if ancestor_id == action.node_id:
+        return state
+      seen.add(ancestor_id)
+      ancestor = state.nodes.get(ancestor_id)
+      ancestor_id = ancestor.parent_id if ancestor is not None else None
 
     nodes = dict(state.nodes)
     nodes[action.node_id] = node.model_copy(update={"parent_id": action.new_parent_id})
@@ -703,64 +843,95 @@ def _apply_mindmap_action(state: MindmapState, action: MindmapAction) -> Mindmap
   return state
 
 
+class _MindmapDraft:
+  # Copies the node/layout dicts on first write; `state` must not be handed out until the run is done.
+  def __init__(self, state: MindmapState) -> None:
+    self.state = state
+    self._owned = False
+
+  def apply(self, action: MindmapAction) -> None:
+    if isinstance(action, UpsertMindmapNodeAction):
+      self._own().nodes[action.node.node_id] = action.node
+    elif isinstance(action, SetMindmapNodePosAction):
+      self._own().layout[action.node_id] = action.pos
+    else:
+      self.state = _apply_mindmap_action(self._own(), action)
+
+  def _own(self) -> MindmapState:
+    if not self._owned:
+      self.state = self.state.model_copy(update={"nodes": dict(self.state.nodes), "layout": dict(self.state.layout)})
+      self._owned = True
+    return self.state
+
+
+def _apply_mindmap_actions_batch(state: MindmapState, actions: list[MindmapAction]) -> MindmapState:
+  draft = _MindmapDraft(state)
+  for action in actions:
+    draft.apply(action)
+  return draft.state
+
+
 def _ensure_meeting_native_mindmap(state: MindmapState, items_by_card_id: dict[str, list[str]]) -> tuple[list[MindmapAction], MindmapState]:
   actions: list[MindmapAction] = []
   next_state = state
 
   if next_state.root_id != MINDMAP_ROOT_ID:
     next_state = next_state.model_copy(update={"root_id": MINDMAP_ROOT_ID})
+  draft = _MindmapDraft(next_state)
 
-  if MINDMAP_ROOT_ID not in next_state.nodes:
+  if MINDMAP_ROOT_ID not in draft.state.nodes:
     root = MindmapNode(node_id=MINDMAP_ROOT_ID, parent_id=None, text="Mindmap")
     actions.append(UpsertMindmapNodeAction(node=root))
-    next_state = _apply_mindmap_action(next_state, actions[-1])
-  if MINDMAP_ROOT_ID not in next_state.layout:
+    draft.apply(actions[-1])
+  if MINDMAP_ROOT_ID not in draft.state.layout:
     pos_action = SetMindmapNodePosAction(node_id=MINDMAP_ROOT_ID, pos=_mindmap_root_pos())
     actions.append(pos_action)
-    next_state = _apply_mindmap_action(next_state, pos_action)
+    draft.apply(pos_action)
 
+  child_counts: Counter[str | None] | None = None
   for idx, (node_id, title, legacy_card_id) in enumerate(MEETING_NATIVE_MINDMAP_CATEGORIES):
-    if node_id not in next_state.nodes:
+    if node_id not in draft.state.nodes:
       cat = MindmapNode(node_id=node_id, parent_id=MINDMAP_ROOT_ID, text=title)
       upsert = UpsertMindmapNodeAction(node=cat)
       actions.append(upsert)
-      next_state = _apply_mindmap_action(next_state, upsert)
-    if node_id not in next_state.layout:
+      draft.apply(upsert)
+    if node_id not in draft.state.layout:
       pos = _mindmap_category_pos(idx)
       pos_action = SetMindmapNodePosAction(node_id=node_id, pos=pos)
       actions.append(pos_action)
-      next_state = _apply_mindmap_action(next_state, pos_action)
+      draft.apply(pos_action)
 
     raw_items = items_by_card_id.get(legacy_card_id) or []
     if not raw_items:
       continue
 
     # Determine next leaf index for autoplace.
-    existing_child_count = sum(1 for n in next_state.nodes.values() if n.parent_id == node_id)
-    leaf_index = existing_child_count
+    if child_counts is None:
+      child_counts = Counter(n.parent_id for n in draft.state.nodes.values())
+    leaf_index = child_counts[node_id]
 
     for raw in raw_items:
       text = raw.strip()
       if not text:
         continue
       leaf_id = _mindmap_leaf_id(node_id, text)
-      if leaf_id in next_state.nodes:
+      if leaf_id in draft.state.nodes:
         continue
 
       leaf = MindmapNode(node_id=leaf_id, parent_id=node_id, text=text)
       upsert = UpsertMindmapNodeAction(node=leaf)
       actions.append(upsert)
-      next_state = _apply_mindmap_action(next_state, upsert)
+      draft.apply(upsert)
 
-      if leaf_id not in next_state.layout:
+      if leaf_id not in draft.state.layout:
         desired = _mindmap_leaf_pos(idx, leaf_index)
-        pos = _mindmap_pick_non_overlapping_pos(next_state, node_id=leaf_id, desired=desired)
+        pos = _mindmap_pick_non_overlapping_pos(draft.state, node_id=leaf_id, desired=desired)
         pos_action = SetMindmapNodePosAction(node_id=leaf_id, pos=pos)
         actions.append(pos_action)
-        next_state = _apply_mindmap_action(next_state, pos_action)
+        draft.apply(pos_action)
       leaf_index += 1
 
-  return actions, next_state
+  return actions, draft.state
 
 
 def _apply_mindmap_path_proposals(
@@ -770,16 +941,22 @@ def _apply_mindmap_path_proposals(
   max_new_nodes: int = 12,
   max_new_root_topics: int = 4,
 ) -> tuple[list[MindmapAction], MindmapState]:
-  seed_actions, next_state = _ensure_meeting_native_mindmap(state, {})
+  seed_actions, seeded_state = _ensure_meeting_native_mindmap(state, {})
   actions: list[MindmapAction] = list(seed_actions)
+  draft = _MindmapDraft(seeded_state)
 
-  category_ids = {node_id for node_id, _, _ in MEETING_NATIVE_MINDMAP_CATEGORIES}
+  category_ids = MEETING_NATIVE_MINDMAP_CATEGORY_IDS
   created = 0
   created_root_topics = 0
   seen_paths: set[str] = set()
 
   capped_max_new_nodes = max(0, int(max_new_nodes))
   capped_max_root_topics = max(0, int(max_new_root_topics))
+  index = _MindmapIndex(draft.state)
+  child_counts = Counter(n.parent_id for n in draft.state.nodes.values())
+  root_topic_count = sum(
+    1 for n in draft.state.nodes.values() if n.parent_id == MINDMAP_ROOT_ID and n.node_id not in category_ids
+  )
 
   for proposal in proposals:
     raw_path = getattr(proposal, "path", None)
@@ -802,28 +979,28 @@ def _apply_mindmap_path_proposals(
       continue
     seen_paths.add(signature)
 
-    parent_id = next_state.root_id
+    parent_id = draft.state.root_id
     for seg in parts:
       reserved = _mindmap_route_reserved_segment(seg)
-      if reserved is not None and reserved in next_state.nodes:
+      if reserved is not None and reserved in draft.state.nodes:
         parent_id = reserved
         continue
 
       # If a segment matches an existing top-level topic, reuse that topic rather than
       # creating a duplicate under some other branch.
       if parent_id != MINDMAP_ROOT_ID:
-        root_match = _mindmap_find_child_by_text(next_state, parent_id=MINDMAP_ROOT_ID, text=seg)
+        root_match = _mindmap_find_child_by_text(draft.state, parent_id=MINDMAP_ROOT_ID, text=seg, index=index)
         if root_match is not None:
           parent_id = root_match
           continue
 
       if _mindmap_should_global_dedupe(seg):
-        global_match = _mindmap_find_any_node_by_similar_text(next_state, seg)
+        global_match = _mindmap_find_any_node_by_similar_text(draft.state, seg, index=index)
         if global_match is not None:
           parent_id = global_match
           continue
 
-      existing = _mindmap_find_child_by_text(next_state, parent_id=parent_id, text=seg)
+      existing = _mindmap_find_child_by_text(draft.state, parent_id=parent_id, text=seg, index=index)
       if existing is not None:
         parent_id = existing
         continue
@@ -840,29 +1017,34 @@ def _apply_mindmap_path_proposals(
       node = MindmapNode(node_id=node_id, parent_id=parent_id, text=seg)
       upsert = UpsertMindmapNodeAction(node=node)
       actions.append(upsert)
-      next_state = _apply_mindmap_action(next_state, upsert)
+      replaced = draft.state.nodes.get(node_id)
+      if replaced is not None:
+        child_counts[replaced.parent_id] -= 1
+        if replaced.parent_id == MINDMAP_ROOT_ID and node_id not in category_ids:
+          root_topic_count -= 1
+      child_counts[parent_id] += 1
+      if parent_id == MINDMAP_ROOT_ID and node_id not in category_ids:
+        root_topic_count += 1
+      draft.apply(upsert)
+      index.add(node)
       created += 1
       if is_root_topic:
         created_root_topics += 1
 
-      if node_id not in next_state.layout:
+      if node_id not in draft.state.layout:
         if parent_id == MINDMAP_ROOT_ID:
-          sibling_index = sum(
-            1
-            for n in next_state.nodes.values()
-            if n.parent_id == parent_id and n.node_id not in category_ids and n.node_id != node_id
-          )
+          sibling_index = root_topic_count - (node_id not in category_ids)
         else:
-          sibling_index = sum(1 for n in next_state.nodes.values() if n.parent_id == parent_id and n.node_id != node_id)
-        desired = _mindmap_auto_pos_for_child(next_state, parent_id=parent_id, sibling_index=sibling_index)
-        pos = _mindmap_pick_non_overlapping_pos(next_state, node_id=node_id, desired=desired)
+          sibling_index = child_counts[parent_id] - 1
+        desired = _mindmap_auto_pos_for_child(draft.state, parent_id=parent_id, sibling_index=sibling_index)
+        pos = _mindmap_pick_non_overlapping_pos(draft.state, node_id=node_id, desired=desired)
         pos_action = SetMindmapNodePosAction(node_id=node_id, pos=pos)
         actions.append(pos_action)
-        next_state = _apply_mindmap_action(next_state, pos_action)
+        draft.apply(pos_action)
 
       parent_id = node_id
 
-  return actions, next_state
+  return actions, draft.state
 
 
 def _env_bool(name: str, default: bool = False) -> bool:
@@ -926,58 +1108,163 @@ def _env_float(name: str, default: float) -> float:
     return default
 
 
+def _ws_message_text(payload: dict[str, Any]) -> str:
+  if orjson is not None:
+    return orjson.dumps(payload).decode("utf-8")
+  return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+async def _send_json(ws: WebSocket, payload: dict[str, Any]) -> None:
+  await ws.send_text(_ws_message_text(payload))
+
+
+_WS_CONNECTED_TEXT = _ws_message_text({"type": "status", "message": "Connected."})
+_WS_MINDMAP_IDLE_TEXT = _ws_message_text({"type": "mindmap_status", "status": "idle"})
+_WS_PONG_TEXT = _ws_message_text({"type": "pong"})
+_WS_AI_RUN_REQUESTED_TEXT = _ws_message_text({"type": "status", "message": "AI run requested by user."})
+_WS_NOT_AN_OBJECT_TEXT = _ws_message_text({"type": "error", "message": "Invalid message; expected JSON object."})
+_WS_INVALID_JSON_TEXT = _ws_message_text({"type": "error", "message": "Invalid message; could not parse JSON."})
+
+
+def _validation_errors(e: ValidationError, *, limit: int = 5) -> list[Any]:
+  return e.errors(include_url=False, include_context=False)[:limit]
+
+
+def _ws_invalid_payload_text(msg_type: str, field_name: str, expected: str) -> str:
+  return _ws_message_text(
+    {"type": "error", "message": f"Invalid {msg_type} payload.", "details": {field_name: expected}}
+  )
+
+
+_WS_INVALID_IMPORT_STATE_TEXT = _ws_invalid_payload_text("import_board", "state", "Expected JSON object.")
+_WS_INVALID_IMPORT_LOCATION_TEXT = _ws_invalid_payload_text(
+  "import_board", "default_location", "Expected non-empty string or null."
+)
+_WS_INVALID_IMPORT_NO_BROWSE_TEXT = _ws_invalid_payload_text("import_board", "no_browse", "Expected boolean or null.")
+_WS_INVALID_CONTEXT_LOCATION_TEXT = _ws_invalid_payload_text(
+  "set_session_context", "default_location", "Expected non-empty string."
+)
+_WS_INVALID_CONTEXT_NO_BROWSE_TEXT = _ws_invalid_payload_text("set_session_context", "no_browse", "Expected boolean.")
+_WS_INVALID_CONTEXT_MINDMAP_AI_TEXT = _ws_invalid_payload_text("set_session_context", "mindmap_ai", "Expected boolean.")
+_WS_INVALID_BOARD_ACTION_TEXT = _ws_invalid_payload_text("client_board_action", "action", "Expected JSON object.")
+_WS_INVALID_MINDMAP_ACTION_TEXT = _ws_invalid_payload_text("client_mindmap_action", "action", "Expected JSON object.")
+
+
 def _actions_to_json(actions: list[BoardAction]) -> list[dict[str, Any]]:
-  return [a.model_dump(mode="json") for a in actions]
+  return _BOARD_ACTIONS_ADAPTER.dump_python(actions, mode="json")
+
+
+# Last JSON dump of each state type, keyed by the state object; callers treat it as read-only.
+_state_json_memo: dict[type[BaseModel], tuple[weakref.ref[BaseModel], dict[str, Any]]] = {}
+
+
+def _dump_state_json(state: BoardState | MindmapState) -> dict[str, Any]:
+  memo = _state_json_memo.get(type(state))
+  if memo is not None and memo[0]() is state:
+    return memo[1]
+  data = state.model_dump(mode="json")
+  _state_json_memo[type(state)] = (weakref.ref(state), data)
+  return data
 
 
 def _state_to_json(state: BoardState) -> dict[str, Any]:
-  return state.model_dump(mode="json")
+  return _dump_state_json(state)
 
 
 def _mindmap_actions_to_json(actions: list[MindmapAction]) -> list[dict[str, Any]]:
-  return [a.model_dump(mode="json") for a in actions]
+  return _MINDMAP_ACTIONS_ADAPTER.dump_python(actions, mode="json")
 
 
 def _mindmap_state_to_json(state: MindmapState) -> dict[str, Any]:
-  return state.model_dump(mode="json")
+  return _dump_state_json(state)
+
+
+def _entries_patch_to_json(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+  # Entries of `new` that aren't the same object in `old`, plus None for removed keys.
+  if old is new:
+    return {}
+  patch = {
+    key: value.model_dump(mode="json") if isinstance(value, BaseModel) else value
+    for key, value in new.items()
+    if old.get(key) is not value
+  }
+  if len(old) > len(new) - len(patch):
+    for key in old:
+      if key not in new:
+        patch[key] = None
+  return patch
+
+
+def _board_patch_to_json(old: BoardState, new: BoardState) -> dict[str, Any]:
+  return {
+    "cards": _entries_patch_to_json(old.cards, new.cards),
+    "layout": _entries_patch_to_json(old.layout, new.layout),
+    "dismissed": _entries_patch_to_json(old.dismissed, new.dismissed),
+  }
 
 
+def _mindmap_patch_to_json(old: MindmapState, new: MindmapState) -> dict[str, Any]:
+  patch: dict[str, Any] = {
+    "nodes": _entries_patch_to_json(old.nodes, new.nodes),
+    "layout": _entries_patch_to_json(old.layout, new.layout),
+  }
+  if new.root_id != old.root_id:
+    patch["root_id"] = new.root_id
+  return patch
+
+
+class _TitleCharMap(dict):
+  # str.translate table: keeps a-z and 0-9, maps everything else to a space.
+  def __missing__(self, key: int) -> str:
+    return " "
+
+
+_TITLE_CHAR_MAP = _TitleCharMap({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789"})
+_TITLE_CHAR_MAP.update({c: " " for c in range(128) if c not in _TITLE_CHAR_MAP})
+
+
+@lru_cache(maxsize=8192)
 def _normalize_title(value: str) -> str:
-  cleaned = re.sub(r"[^a-z0-9]+", " ", value.lower())
-  return " ".join(cleaned.split())
+  return " ".join(value.lower().translate(_TITLE_CHAR_MAP).split())
+
 
+@lru_cache(maxsize=8192)
+def _title_tokens(normalized: str) -> frozenset[str]:
+  return frozenset(normalized.split())
 
-def _title_similarity(a: str, b: str) -> float:
-  a_norm = _normalize_title(a)
-  b_norm = _normalize_title(b)
+
+def _normalized_title_similarity(a_norm: str, b_norm: str) -> float:
   if not a_norm or not b_norm:
     return 0.0
   if a_norm == b_norm:
     return 1.0
-  a_tokens = set(a_norm.split())
-  b_tokens = set(b_norm.split())
+  a_tokens = _title_tokens(a_norm)
+  b_tokens = _title_tokens(b_norm)
   if not a_tokens or not b_tokens:
     return 0.0
   return len(a_tokens & b_tokens) / len(a_tokens | b_tokens)
 
 
-def _very_similar_title(a: str, b: str) -> bool:
-  a_norm = _normalize_title(a)
-  b_norm = _normalize_title(b)
+def _very_similar_normalized_titles(a_norm: str, b_norm: str) -> bool:
   if not a_norm or not b_norm:
     return False
   if a_norm == b_norm:
     return True
 
-  if _title_similarity(a_norm, b_norm) >= 0.85:
+  a_tokens = _title_tokens(a_norm)
+  b_tokens = _title_tokens(b_norm)
+  shared = len(a_tokens & b_tokens)
+  is_substring = (a_norm in b_norm or b_norm in a_norm) and min(len(a_norm), len(b_norm)) >= 12
+  if not shared:
+    return is_substring
+
+  if shared / (len(a_tokens) + len(b_tokens) - shared) >= 0.85:
     return True
 
-  if (a_norm in b_norm or b_norm in a_norm) and min(len(a_norm), len(b_norm)) >= 12:
+  if is_substring:
     return True
 
-  a_tokens = set(a_norm.split())
-  b_tokens = set(b_norm.split())
-  overlap = len(a_tokens & b_tokens) / min(len(a_tokens), len(b_tokens))
+  overlap = shared / min(len(a_tokens), len(b_tokens))
   return overlap >= 0.9
 
 
@@ -987,7 +1274,29 @@ def _card_title_for_match(card: Any) -> str:
   return title if isinstance(title, str) else ""
 
 
-def _find_similar_card_id(state: BoardState, *, kind: Any, title: str) -> str | None:
+def _card_title_index(state: BoardState) -> dict[tuple[Any, frozenset[str]], str]:
+  # (kind, title tokens) -> first card with exactly those tokens.
+  index: dict[tuple[Any, frozenset[str]], str] = {}
+  for card_id, card in state.cards.items():
+    tokens = _title_tokens(_normalize_title(_card_title_for_match(card)))
+    if tokens:
+      index.setdefault((getattr(card, "kind", None), tokens), card_id)
+  return index
+
+
+def _find_similar_card_id(
+  state: BoardState,
+  *,
+  kind: Any,
+  title: str,
+  title_index: dict[tuple[Any, frozenset[str]], str] | None = None,
+) -> str | None:
+  if title_index is not None:
+    exact_id = title_index.get((kind, _title_tokens(_normalize_title(title))))
+    if exact_id is not None:
+      return exact_id
+
+  title_norm = _normalize_title(title)
   best_id: str | None = None
   best_score = 0.0
   for card_id, card in state.cards.items():
@@ -996,9 +1305,10 @@ def _find_similar_card_id(state: BoardState, *, kind: Any, title: str) -> str |
     existing_title = _card_title_for_match(card)
     if not existing_title:
       continue
-    if not _very_similar_title(existing_title, title):
+    existing_norm = _normalize_title(existing_title)
+    if not _very_similar_normalized_titles(existing_norm, title_norm):
       continue
-    score = _title_similarity(existing_title, title)
+    score = _normalized_title_similarity(existing_norm, title_norm)
     if score > best_score:
       best_id = card_id
       best_score = score
@@ -1013,13 +1323,55 @@ def _normalize_transcript_speaker(speaker: str | None) -> str:
   return " ".join((speaker or "").strip().lower().split())
 
 
+def _transcript_signature(event: TranscriptEvent) -> tuple[str, str]:
+  return _normalize_transcript_speaker(event.speaker), _normalize_transcript_text(event.text)
+
+
+@dataclass(frozen=True, slots=True)
+class _MindmapTranscriptWindow:
+  events: list[TranscriptEvent]
+  latest: TranscriptEvent | None
+  has_final: bool
+
+
+def _mindmap_transcript_window(
+  transcript: deque[tuple[float, TranscriptEvent]], *, max_final: int = 18
+) -> _MindmapTranscriptWindow:
+  finals: list[TranscriptEvent] = []
+  latest_interim: TranscriptEvent | None = None
+  for _, event in reversed(transcript):
+    if event.is_final:
+      if len(finals) < max_final:
+        finals.append(event)
+    elif latest_interim is None:
+      latest_interim = event
+    if len(finals) >= max_final and latest_interim is not None:
+      break
+  has_final = bool(finals)
+  window = finals[::-1]
+  if latest_interim is not None:
+    if not window or latest_interim.timestamp >= window[-1].timestamp:
+      if len(latest_interim.text.strip()) >= 24:
+        window.append(latest_interim)
+  return _MindmapTranscriptWindow(
+    events=window, latest=transcript[-1][1] if transcript else None, has_final=has_final
+  )
+
+
 @dataclass
 class RealtimeState:
   clients: set[WebSocket] = field(default_factory=set)
   clients_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
-  transcript: deque[tuple[float, TranscriptEvent]] = field(default_factory=deque)
+  transcript: deque[tuple[float, TranscriptEvent]] = field(
+    default_factory=lambda: deque(maxlen=max(1, _env_int("MEETINGGENIUS_TRANSCRIPT_MAX_EVENTS", 50)))
+  )
   transcript_version: int = 0
+  # event_id -> sequence number; the entry sits at `seq - transcript_evicted` in the deque.
+  transcript_seq_by_event_id: dict[str, int] = field(default_factory=dict)
+  transcript_evicted: int = 0
+  transcript_tail_signature: tuple[TranscriptEvent, tuple[str, str]] | None = None
+  meeting_native_cache: tuple[int, dict[str, list[str]]] | None = None
   board_state: BoardState = field(default_factory=BoardState.empty)
   mindmap_state: MindmapState = field(default_factory=MindmapState.empty)
   default_location: str | None = None
@@ -1027,12 +1379,36 @@ class RealtimeState:
   mindmap_ai_override: bool | None = None
   version: int = 0
   mindmap_version: int = 0
-  state_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+  transcript_max_seconds: int = field(default_factory=lambda: _env_int("MEETINGGENIUS_TRANSCRIPT_MAX_SECONDS", 120))
+  mindmap_ai_default: bool = field(default_factory=lambda: _env_bool("MEETINGGENIUS_MINDMAP_AI", True))
+  default_location_fallback: str = field(
+    default_factory=lambda: os.getenv("MEETINGGENIUS_DEFAULT_LOCATION") or "Seattle"
+  )
+  broadcast_batch_seconds: float = field(
+    default_factory=lambda: _env_float("MEETINGGENIUS_BROADCAST_BATCH_SECONDS", 0.05)
+  )
+  pending_broadcasts: list[dict[str, Any]] = field(default_factory=list)
+  broadcast_flush_task: asyncio.Task[None] | None = None
+  last_broadcast_board: tuple[int, BoardState] | None = None
+  last_broadcast_mindmap: tuple[int, MindmapState] | None = None
+  # Queued message still open for merging, with the broadcast it patches from (None: full state).
+  pending_board_broadcast: tuple[dict[str, Any], tuple[int, BoardState] | None] | None = None
+  pending_mindmap_broadcast: tuple[dict[str, Any], tuple[int, MindmapState] | None] | None = None
+  # Lock order: settings -> transcript -> board -> mindmap. Writers never await while holding a lock,
+  # so plain reads skip the locks.
+  settings_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+  transcript_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+  board_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+  mindmap_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
   ai_runner: "AIRunner" | None = None
   mindmap_ai_runner: "MindmapAIRunner" | None = None
+  transcript_followup_task: asyncio.Task[None] | None = None
+  transcript_followup_pending: bool = False
+  transcript_followup_final: bool = False
 
   async def add_client(self, ws: WebSocket) -> None:
+    await self.flush_broadcasts()
     async with self.clients_lock:
       self.clients.add(ws)
 
@@ -1041,15 +1417,44 @@ class RealtimeState:
       self.clients.discard(ws)
 
   async def broadcast(self, payload: dict[str, Any]) -> None:
+    if self.broadcast_batch_seconds <= 0:
+      await self.broadcast_now(payload)
+      return
+    self.pending_broadcasts.append(payload)
+    if self.broadcast_flush_task is None:
+      self.broadcast_flush_task = asyncio.create_task(self._flush_broadcasts_later())
+
+  async def broadcast_now(self, payload: dict[str, Any]) -> None:
+    self.pending_broadcasts.append(payload)
+    await self.flush_broadcasts()
+
+  async def flush_broadcasts(self) -> None:
+    if not self.pending_broadcasts:
+      return
+    if not self.clients:
+      self.pending_broadcasts = []
+      self.pending_board_broadcast = None
+      self.pending_mindmap_broadcast = None
+      return
+    self._finish_pending_state_broadcasts()
+    messages = self.pending_broadcasts
+    self.pending_broadcasts = []
+    await self._send_to_clients(messages[0] if len(messages) == 1 else {"type": "batch", "messages": messages})
+
+  async def _flush_broadcasts_later(self) -> None:
+    await asyncio.sleep(self.broadcast_batch_seconds)
+    self.broadcast_flush_task = None
+    await self.flush_broadcasts()
+
+  async def _send_to_clients(self, payload: dict[str, Any]) -> None:
     async with self.clients_lock:
       clients = list(self.clients)
+    if not clients:
+      return
 
-    to_remove: list[WebSocket] = []
-    for ws in clients:
-      try:
-        await ws.send_json(payload)
-      except Exception:
-        to_remove.append(ws)
+    text = _ws_message_text(payload)
+    results = await asyncio.gather(*(ws.send_text(text) for ws in clients), return_exceptions=True)
+    to_remove = [ws for ws, result in zip(clients, results) if isinstance(result, Exception)]
 
     if to_remove:
       async with self.clients_lock:
@@ -1059,123 +1464,253 @@ class RealtimeState:
   async def status(self, message: str) -> None:
     await self.broadcast({"type": "status", "message": message})
 
+  # Broadcasts carry the actions plus a patch from `base_version`; a client at another version sends
+  # `sync`. Updates queued within one batch window are merged into the first queued message.
+  async def broadcast_board(
+    self, actions: list[dict[str, Any]], state: BoardState, version: int, *, full_state: bool = False
+  ) -> None:
+    previous = self.last_broadcast_board
+    self.last_broadcast_board = (version, state)
+    pending = self.pending_board_broadcast
+    if pending is not None:
+      payload = pending[0]
+      payload["version"] = version
+      if full_state:
+        # Reset/import: the new state doesn't follow from the queued actions, so they're dropped.
+        payload["actions"] = list(actions)
+        self.pending_board_broadcast = (payload, None)
+      else:
+        payload["actions"].extend(actions)
+      return
+    payload = {"type": "board_actions", "actions": list(actions), "version": version}
+    self.pending_board_broadcast = (payload, None if full_state else previous)
+    await self.broadcast(payload)
+
+  async def broadcast_mindmap(
+    self, actions: list[dict[str, Any]], state: MindmapState, version: int, *, full_state: bool = False
+  ) -> None:
+    previous = self.last_broadcast_mindmap
+    self.last_broadcast_mindmap = (version, state)
+    pending = self.pending_mindmap_broadcast
+    if pending is not None:
+      payload = pending[0]
+      payload["version"] = version
+      if full_state:
+        payload["actions"] = list(actions)
+        self.pending_mindmap_broadcast = (payload, None)
+      else:
+        payload["actions"].extend(actions)
+      return
+    payload = {"type": "mindmap_actions", "actions": list(actions), "version": version}
+    self.pending_mindmap_broadcast = (payload, None if full_state else previous)
+    await self.broadcast(payload)
+
+  def _finish_pending_state_broadcasts(self) -> None:
+    if self.pending_board_broadcast is not None and self.last_broadcast_board is not None:
+      payload, base = self.pending_board_broadcast
+      self.pending_board_broadcast = None
+      state = self.last_broadcast_board[1]
+      if base is None:
+        payload["state"] = _state_to_json(state)
+      else:
+        payload["base_version"] = base[0]
+        payload["patch"] = _board_patch_to_json(base[1], state)
+
+    if self.pending_mindmap_broadcast is not None and self.last_broadcast_mindmap is not None:
+      payload, base = self.pending_mindmap_broadcast
+      self.pending_mindmap_broadcast = None
+      state = self.last_broadcast_mindmap[1]
+      if base is None:
+        payload["state"] = _mindmap_state_to_json(state)
+      else:
+        payload["base_version"] = base[0]
+        payload["patch"] = _mindmap_patch_to_json(base[1], state)
+
+  def board_state_message(self) -> dict[str, Any]:
+    return {"type": "board_actions", "actions": [], "state": _state_to_json(self.board_state), "version": self.version}
+
+  def mindmap_state_message(self) -> dict[str, Any]:
+    return {
+      "type": "mindmap_actions",
+      "actions": [],
+      "state": _mindmap_state_to_json(self.mindmap_state),
+      "version": self.mindmap_version,
+    }
+
+  async def sync_messages(self) -> list[dict[str, Any]]:
+    # Queued patches are based on an older version than these states; flush them first.
+    await self.flush_broadcasts()
+    return [self.board_state_message(), self.mindmap_state_message()]
+
   async def error(self, message: str, *, details: dict[str, Any] | None = None) -> None:
     payload: dict[str, Any] = {"type": "error", "message": message}
     if details is not None:
       payload["details"] = details
-    await self.broadcast(payload)
+    await self.broadcast_now(payload)
 
   async def reset(self) -> None:
-    async with self.state_lock:
-      self.transcript.clear()
+    async with self.settings_lock, self.transcript_lock, self.board_lock, self.mindmap_lock:
+      previous = (self.transcript, self.transcript_seq_by_event_id, self.board_state, self.mindmap_state)
+      self.transcript = deque(maxlen=self.transcript.maxlen)
+      self.transcript_seq_by_event_id = {}
+      self.transcript_tail_signature = None
       self.transcript_version += 1
-      self.board_state = BoardState.empty()
+      self.board_state = EMPTY_BOARD_STATE
       self.mindmap_state = MindmapState.empty()
       self.default_location = None
       self.no_browse_override = None
       self.mindmap_ai_override = None
       self.version += 1
       self.mindmap_version += 1
+      version = self.version
+      mindmap_version = self.mindmap_version
+      mindmap_state = self.mindmap_state
+    del previous
     if PERSISTOR is not None:
       await PERSISTOR.schedule_clear()
     await self.status("State reset.")
-    await self.broadcast({"type": "board_actions", "actions": [], "state": _state_to_json(BoardState.empty())})
-    await self.broadcast(
-      {"type": "mindmap_actions", "actions": [], "state": _mindmap_state_to_json(MindmapState.empty())}
-    )
-    await self.broadcast({"type": "mindmap_status", "status": "idle"})
+    await self.broadcast_board([], EMPTY_BOARD_STATE, version, full_state=True)
+    await self.broadcast_mindmap([], mindmap_state, mindmap_version, full_state=True)
+    await self.broadcast_now({"type": "mindmap_status", "status": "idle"})
 
   async def add_transcript_event(self, event: TranscriptEvent) -> None:
-    max_events = _env_int("MEETINGGENIUS_TRANSCRIPT_MAX_EVENTS", 50)
-    max_seconds = _env_int("MEETINGGENIUS_TRANSCRIPT_MAX_SECONDS", 120)
-
     now = time.time()
-    cutoff = now - max_seconds
+    cutoff = now - self.transcript_max_seconds
 
-    async with self.state_lock:
+    async with self.transcript_lock:
       replaced = False
       if event.event_id:
-        for idx, (ts, existing) in enumerate(self.transcript):
-          if existing.event_id == event.event_id:
-            self.transcript[idx] = (ts, event)
-            self.transcript_version += 1
-            replaced = True
-            break
+        seq = self.transcript_seq_by_event_id.get(event.event_id)
+        if seq is not None:
+          idx = seq - self.transcript_evicted
+          ts, _ = self.transcript[idx]
+          self.transcript[idx] = (ts, event)
+          self.transcript_version += 1
+          replaced = True
 
       if not replaced:
-        if not event.event_id and self.transcript:
-          _, last_event = self.transcript[-1]
-          if (
-            _normalize_transcript_speaker(last_event.speaker)
-            == _normalize_transcript_speaker(event.speaker)
-            and _normalize_transcript_text(last_event.text) == _normalize_transcript_text(event.text)
-          ):
-            return
-
+        if not event.event_id:
+          signature = _transcript_signature(event)
+          if self.transcript:
+            _, last_event = self.transcript[-1]
+            tail = self.transcript_tail_signature
+            if tail is not None and tail[0] is last_event:
+              last_signature = tail[1]
+            else:
+              last_signature = _transcript_signature(last_event)
+            if last_signature == signature:
+              return
+          self.transcript_tail_signature = (event, signature)
+
+        # Evict before a full deque drops the entry, so the event_id index stays in sync.
+        if len(self.transcript) == self.transcript.maxlen:
+          self._evict_oldest_transcript_event()
+        if event.event_id:
+          self.transcript_seq_by_event_id[event.event_id] = self.transcript_evicted + len(self.transcript)
         self.transcript.append((now, event))
         self.transcript_version += 1
       while self.transcript and self.transcript[0][0] < cutoff:
-        self.transcript.popleft()
-      while len(self.transcript) > max_events:
-        self.transcript.popleft()
-
-  async def snapshot(self) -> tuple[int, list[TranscriptEvent], BoardState]:
-    async with self.state_lock:
-      version = self.version
+        self._evict_oldest_transcript_event()
+
+  def meeting_native_items(
+    self, transcript_version: int, events: list[TranscriptEvent] | None = None
+  ) -> dict[str, list[str]]:
+    # `events` must be the transcript at `transcript_version`; the result must not be mutated.
+    cache = self.meeting_native_cache
+    if cache is not None and cache[0] == transcript_version:
+      return cache[1]
+    if events is None:
       events = [e for _, e in self.transcript]
-      state = self.board_state
-    return version, events, state
+    items = _extract_meeting_native_items(events)
+    self.meeting_native_cache = (transcript_version, items)
+    return items
 
-  async def snapshot_mindmap_ai(self) -> tuple[int, int, list[TranscriptEvent], MindmapState, bool | None]:
-    async with self.state_lock:
-      version = self.mindmap_version
-      transcript_version = self.transcript_version
-      events = [e for _, e in self.transcript]
-      state = self.mindmap_state
-      mindmap_ai = self.mindmap_ai_override
-    return version, transcript_version, events, state, mindmap_ai
+  def _evict_oldest_transcript_event(self) -> None:
+    _, evicted = self.transcript.popleft()
+    self.transcript_evicted += 1
+    if evicted.event_id:
+      self.transcript_seq_by_event_id.pop(evicted.event_id, None)
 
-  async def get_mindmap_state(self) -> MindmapState:
-    async with self.state_lock:
-      return self.mindmap_state
+  async def snapshot(self) -> tuple[int, list[TranscriptEvent], BoardState]:
+    return self.version, [e for _, e in self.transcript], self.board_state
+
+  async def snapshot_mindmap_ai(self) -> tuple[int, int, _MindmapTranscriptWindow, MindmapState, bool | None]:
+    return (
+      self.mindmap_version,
+      self.transcript_version,
+      _mindmap_transcript_window(self.transcript),
+      self.mindmap_state,
+      self.mindmap_ai_override,
+    )
 
   async def apply_mindmap_actions_now(self, actions: list[MindmapAction]) -> tuple[int, MindmapState]:
-    async with self.state_lock:
-      next_state = self.mindmap_state
-      for action in actions:
-        next_state = _apply_mindmap_action(next_state, action)
+    async with self.mindmap_lock:
+      previous = self.mindmap_state
+      next_state = _apply_mindmap_actions_batch(previous, actions)
       self.mindmap_state = next_state
       self.mindmap_version += 1
       version = self.mindmap_version
+    del previous
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
     return version, next_state
 
-  async def update_meeting_native_mindmap(self) -> tuple[list[MindmapAction], MindmapState] | None:
-    async with self.state_lock:
-      events = [e for _, e in self.transcript]
-      mindmap_state = self.mindmap_state
+  async def update_meeting_native_mindmap(self) -> tuple[list[MindmapAction], int, MindmapState] | None:
+    items_by_card_id = self.meeting_native_items(self.transcript_version)
 
-      items_by_card_id = _extract_meeting_native_items(events)
+    async with self.mindmap_lock:
+      mindmap_state = self.mindmap_state
       actions, next_state = _ensure_meeting_native_mindmap(mindmap_state, items_by_card_id)
       if not actions:
         return None
 
       self.mindmap_state = next_state
       self.mindmap_version += 1
+      version = self.mindmap_version
 
+    del mindmap_state
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
-    return actions, next_state
+    return actions, version, next_state
+
+  def request_transcript_followup(self, *, is_final: bool) -> None:
+    self.transcript_followup_pending = True
+    self.transcript_followup_final = self.transcript_followup_final or is_final
+    if self.transcript_followup_task is None or self.transcript_followup_task.done():
+      self.transcript_followup_task = asyncio.create_task(self._run_transcript_followups())
+
+  async def _run_transcript_followups(self) -> None:
+    while self.transcript_followup_pending:
+      self.transcript_followup_pending = False
+      is_final = self.transcript_followup_final
+      self.transcript_followup_final = False
+      try:
+        await self._transcript_followup(is_final=is_final)
+      except Exception as e:
+        await self.error(
+          "Failed to process transcript update.",
+          details={"error": str(e), "traceback": traceback.format_exc(limit=25)},
+        )
+
+  async def _transcript_followup(self, *, is_final: bool) -> None:
+    updated = await self.update_meeting_native_mindmap()
+    if updated is not None:
+      actions, next_version, next_state = updated
+      await self.broadcast_mindmap(_mindmap_actions_to_json(actions), next_state, next_version)
+    mindmap_ai_override = await self.get_mindmap_ai_override()
+    mindmap_ai_enabled = mindmap_ai_override if mindmap_ai_override is not None else self.mindmap_ai_default
+    if mindmap_ai_enabled and self.mindmap_ai_runner is not None:
+      await self.mindmap_ai_runner.request()
+    if is_final and self.ai_runner is not None:
+      await self.ai_runner.request()
 
   async def board_export_payload(self) -> dict[str, Any]:
-    async with self.state_lock:
-      payload: dict[str, Any] = {"type": "board_export", "state": _state_to_json(self.board_state)}
-      if self.default_location is not None:
-        payload["default_location"] = self.default_location
-      if self.no_browse_override is not None:
-        payload["no_browse"] = self.no_browse_override
-      return payload
+    payload: dict[str, Any] = {"type": "board_export", "state": _state_to_json(self.board_state)}
+    if self.default_location is not None:
+      payload["default_location"] = self.default_location
+    if self.no_browse_override is not None:
+      payload["no_browse"] = self.no_browse_override
+    return payload
 
   async def replace_board_state(
     self,
@@ -1185,67 +1720,69 @@ class RealtimeState:
     default_location: str | None,
     has_no_browse: bool,
     no_browse: bool | None,
-  ) -> BoardState:
-    async with self.state_lock:
+  ) -> tuple[int, BoardState]:
+    async with self.settings_lock, self.board_lock:
+      previous = self.board_state
       self.board_state = state
       if has_default_location:
         self.default_location = default_location
       if has_no_browse:
         self.no_browse_override = no_browse
       self.version += 1
-      return self.board_state
+      version = self.version
+    del previous
+    if PERSISTOR is not None:
+      await PERSISTOR.schedule_save()
+    return version, state
 
   async def get_default_location(self) -> str | None:
-    async with self.state_lock:
-      return self.default_location
+    return self.default_location
 
   async def set_default_location(self, value: str) -> None:
-    async with self.state_lock:
+    async with self.settings_lock:
       self.default_location = value
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
 
   async def get_no_browse_override(self) -> bool | None:
-    async with self.state_lock:
-      return self.no_browse_override
+    return self.no_browse_override
 
   async def set_no_browse_override(self, value: bool | None) -> None:
-    async with self.state_lock:
+    async with self.settings_lock:
       self.no_browse_override = value
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
 
   async def get_mindmap_ai_override(self) -> bool | None:
-    async with self.state_lock:
-      return self.mindmap_ai_override
+    return self.mindmap_ai_override
 
   async def set_mindmap_ai_override(self, value: bool | None) -> None:
-    async with self.state_lock:
+    async with self.settings_lock:
       self.mindmap_ai_override = value
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
 
-  async def apply_board_actions(self, *, expected_version: int, actions: list[BoardAction]) -> BoardState | None:
-    async with self.state_lock:
+  async def commit_board_state(self, state: BoardState, *, expected_version: int) -> tuple[int, BoardState] | None:
+    # `state` was computed from the snapshot at `expected_version`; it only lands if nothing changed since.
+    async with self.board_lock:
       if self.version != expected_version:
         return None
-      next_state = self.board_state
-      for action in actions:
-        next_state = apply_action(next_state, action)
-      self.board_state = next_state
+      previous = self.board_state
+      self.board_state = next_state = state
       self.version += 1
+      version = self.version
+    del previous
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
-    return next_state
+    return version, next_state
 
   async def apply_board_actions_now(self, actions: list[BoardAction]) -> tuple[int, BoardState]:
-    async with self.state_lock:
-      next_state = self.board_state
-      for action in actions:
-        next_state = apply_action(next_state, action)
-      self.board_state = next_state
+    async with self.board_lock:
+      previous = self.board_state
+      self.board_state = next_state = _apply_board_actions(previous, actions)
       self.version += 1
       version = self.version
+    del previous
     if PERSISTOR is not None:
       await PERSISTOR.schedule_save()
     return version, next_state
@@ -1255,49 +1792,58 @@ class AIRunner:
   def __init__(self, state: RealtimeState) -> None:
     self._state = state
     self._min_interval_s = _env_float("MEETINGGENIUS_AI_MIN_INTERVAL_SECONDS", 10.0)
-    self._lock = asyncio.Lock()
+    self._model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
+    self._dedupe_enabled = _env_bool("MEETINGGENIUS_DEDUPE_TITLE_SIMILARITY", True)
+    self._max_creates_per_minute = _env_int("MEETINGGENIUS_MAX_CREATE_CARDS_PER_MINUTE", 2)
+    self._min_seconds_between_creates = _env_float("MEETINGGENIUS_MIN_SECONDS_BETWEEN_CREATES", 20.0)
     self._task: asyncio.Task[None] | None = None
     self._pending = False
-    self._last_started_at = 0.0
-    self._create_timestamps: deque[float] = deque()
-    self._last_create_at = 0.0
+    self._last_started_at = float("-inf")
+    self._create_timestamps: deque[float] = deque(maxlen=max(0, self._max_creates_per_minute))
+    self._last_create_at = float("-inf")
+    self._last_processed_transcript_version = -1
+    self._force = False
     self._warned_missing_ai_config = False
 
-  async def request(self) -> None:
-    async with self._lock:
-      self._pending = True
-      if self._task is None or self._task.done():
-        self._task = asyncio.create_task(self._run_loop())
+  async def request(self, *, force: bool = False) -> None:
+    self._pending = True
+    self._force = self._force or force
+    if self._task is None or self._task.done():
+      self._task = asyncio.create_task(self._run_loop())
 
   async def _run_loop(self) -> None:
     while True:
-      async with self._lock:
-        if not self._pending:
-          return
-        self._pending = False
-        delay = max(0.0, self._min_interval_s - (time.time() - self._last_started_at))
+      if not self._pending:
+        return
+      self._pending = False
+      force = self._force
+      self._force = False
+      delay = max(0.0, self._min_interval_s - (time.monotonic() - self._last_started_at))
 
       if delay > 0:
         await asyncio.sleep(delay)
 
-      self._last_started_at = time.time()
+      self._last_started_at = time.monotonic()
       try:
-        await self._run_once()
+        await self._run_once(force=force)
       except Exception as e:
-        model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
         await self._state.error(
-          _humanize_ai_error(e, model=model),
+          _humanize_ai_error(e, model=self._model),
           details={"error": str(e), "traceback": traceback.format_exc(limit=25)},
         )
 
-  async def _run_once(self) -> None:
+  async def _run_once(self, *, force: bool = False) -> None:
+    transcript_version = self._state.transcript_version
+    if not force and transcript_version == self._last_processed_transcript_version:
+      return
+
     version, events, board_state = await self._state.snapshot()
     if not events:
       return
 
-    model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
+    model = self._model
     session_location = await self._state.get_default_location()
-    default_location = session_location or (os.getenv("MEETINGGENIUS_DEFAULT_LOCATION") or "Seattle")
+    default_location = session_location or self._state.default_location_fallback
     session_no_browse = await self._state.get_no_browse_override()
     no_browse = session_no_browse if session_no_browse is not None else _env_bool("MEETINGGENIUS_NO_BROWSE", False)
     policy = ToolingPolicy(no_browse=no_browse)
@@ -1310,32 +1856,27 @@ class AIRunner:
       await self._state.status(f"AI disabled: {missing_ai_hint}")
       self._warned_missing_ai_config = True
     if offline_meeting_native:
-      items_by_card_id = _extract_meeting_native_items(events)
+      items_by_card_id = self._state.meeting_native_items(transcript_version, events)
       actions, post_process_state = _meeting_native_create_or_update_actions(board_state, items_by_card_id, max_new_items=5)
 
       if not actions:
+        self._last_processed_transcript_version = transcript_version
         return
 
-      processed_actions, throttle_msg, next_timestamps, next_last_create = self._post_process_actions(
-        post_process_state, actions
-      )
-      next_state = await self._state.apply_board_actions(expected_version=version, actions=processed_actions)
-      if next_state is None:
+      processed_actions, throttle_msg, created_at = self._post_process_actions(post_process_state, actions)
+      if processed_actions != actions:
+        post_process_state = _apply_board_actions(board_state, processed_actions)
+      applied = await self._state.commit_board_state(post_process_state, expected_version=version)
+      if applied is None:
         await self._state.status("Discarded meeting-native result (state changed).")
         return
 
-      self._create_timestamps = next_timestamps
-      self._last_create_at = next_last_create
+      self._last_processed_transcript_version = transcript_version
+      self._record_creates(created_at)
       if throttle_msg:
         await self._state.status(throttle_msg)
 
-      await self._state.broadcast(
-        {
-          "type": "board_actions",
-          "actions": _actions_to_json(processed_actions),
-          "state": _state_to_json(next_state),
-        }
-      )
+      await self._state.broadcast_board(_actions_to_json(processed_actions), applied[1], applied[0])
       return
 
     await self._state.status("Running orchestrator…")
@@ -1377,9 +1918,7 @@ class AIRunner:
         "Return a valid OrchestratorDecision for this context.",
       ]
     ).strip()
-    decision = await asyncio.to_thread(
-      lambda: orchestrator.run_sync(orchestrator_prompt, deps=orchestrator_deps).output
-    )
+    decision = (await orchestrator.run(orchestrator_prompt, deps=orchestrator_deps)).output
 
     tasks = decision.research_tasks
     if no_browse and tasks:
@@ -1394,15 +1933,22 @@ class AIRunner:
         decision = decision.model_copy(update={"research_tasks": tasks})
 
     results = []
+    results_json: list[str] = []
     if tasks:
       await self._state.status(f"Research tasks: {len(tasks)}")
 
-    for task in tasks:
-      try:
-        results.append(await run_research_task(task, no_browse=no_browse))
-      except Exception as e:
+    outcomes = await asyncio.gather(
+      *(run_research_task(task, no_browse=no_browse) for task in tasks), return_exceptions=True
+    )
+    for task, outcome in zip(tasks, outcomes):
+      if isinstance(outcome, Exception):
         label = task.tool_name or task.kind
-        await self._state.status(f"Research failed for {label}: {e}")
+        await self._state.status(f"Research failed for {label}: {outcome}")
+      elif isinstance(outcome, BaseException):
+        raise outcome
+      else:
+        results.append(outcome)
+        results_json.append(outcome.model_dump_json())
 
     await self._state.status("Running board planner…")
     planner = build_board_planner_agent(model)
@@ -1427,19 +1973,17 @@ class AIRunner:
         "- Meeting-native artifacts (decisions/actions/questions/risks/next steps) are always allowed even if external research is disabled; they should have sources=[] and no citations.",
         "",
         "Orchestrator decision (JSON):",
-        decision.model_dump_json(indent=2),
+        decision.model_dump_json(),
         "",
         "Research results (JSON):",
-        json.dumps([r.model_dump(mode="json") for r in results], indent=2),
+        f"[{','.join(results_json)}]",
         "",
         "Output a JSON array that schema-validates as a list of BoardAction objects.",
       ]
     ).strip()
     if no_browse:
       planner_prompt += "\n\nNote: external research is disabled; avoid creating factual external-data cards."
-    actions = await asyncio.to_thread(
-      lambda: planner.run_sync(planner_prompt, deps=planner_deps).output
-    )
+    actions = (await planner.run(planner_prompt, deps=planner_deps)).output
 
     seed_actions = _meeting_native_seed_actions(board_state, actions)
     post_process_state = board_state
@@ -1448,7 +1992,7 @@ class AIRunner:
       for action in seed_actions:
         post_process_state = apply_action(post_process_state, action)
 
-    items_by_card_id = _extract_meeting_native_items(events)
+    items_by_card_id = self._state.meeting_native_items(transcript_version, events)
     if items_by_card_id:
       pre_fallback_state = post_process_state
       for action in actions:
@@ -1464,9 +2008,7 @@ class AIRunner:
         actions = actions + fallback_actions
         post_process_state = fallback_state
 
-    processed_actions, throttle_msg, next_timestamps, next_last_create = self._post_process_actions(
-      post_process_state, actions
-    )
+    processed_actions, throttle_msg, created_at = self._post_process_actions(post_process_state, actions)
 
     if no_browse:
       sanitized: list[BoardAction] = []
@@ -1494,32 +2036,28 @@ class AIRunner:
 
       processed_actions = sanitized
 
-    next_state = await self._state.apply_board_actions(expected_version=version, actions=processed_actions)
-    if next_state is None:
+    next_state = _apply_board_actions(board_state, processed_actions)
+    applied = await self._state.commit_board_state(next_state, expected_version=version)
+    if applied is None:
       await self._state.status("Discarded AI result (state changed).")
       return
 
-    self._create_timestamps = next_timestamps
-    self._last_create_at = next_last_create
+    self._last_processed_transcript_version = transcript_version
+    self._record_creates(created_at)
     if throttle_msg:
       await self._state.status(throttle_msg)
 
-    await self._state.broadcast(
-      {
-        "type": "board_actions",
-        "actions": _actions_to_json(processed_actions),
-        "state": _state_to_json(next_state),
-      }
-    )
+    await self._state.broadcast_board(_actions_to_json(processed_actions), applied[1], applied[0])
 
   def _post_process_actions(
     self, board_state: BoardState, actions: list[BoardAction]
-  ) -> tuple[list[BoardAction], str | None, deque[float], float]:
-    dedupe_enabled = _env_bool("MEETINGGENIUS_DEDUPE_TITLE_SIMILARITY", True)
-    max_per_minute = _env_int("MEETINGGENIUS_MAX_CREATE_CARDS_PER_MINUTE", 2)
-    min_between_s = _env_float("MEETINGGENIUS_MIN_SECONDS_BETWEEN_CREATES", 20.0)
+  ) -> tuple[list[BoardAction], str | None, list[float]]:
+    dedupe_enabled = self._dedupe_enabled
+    max_per_minute = self._max_creates_per_minute
+    min_between_s = self._min_seconds_between_creates
 
     deduped: list[BoardAction] = []
+    title_index: dict[tuple[Any, frozenset[str]], str] | None = None
     for action in actions:
       if isinstance(action, CreateCardAction) and action.card.card_id in MEETING_NATIVE_BASE_LIST_CARD_IDS:
         deduped.append(action)
@@ -1534,9 +2072,15 @@ class AIRunner:
         deduped.append(action)
         continue
 
-      similar_id = _find_similar_card_id(board_state, kind=getattr(card, "kind", None), title=title)
+      if title_index is None:
+        title_index = _card_title_index(board_state)
+      kind = getattr(card, "kind", None)
+      similar_id = _find_similar_card_id(board_state, kind=kind, title=title, title_index=title_index)
       if similar_id is None:
         deduped.append(action)
+        tokens = _title_tokens(_normalize_title(title))
+        if tokens:
+          title_index.setdefault((kind, tokens), card.card_id)
         continue
 
       patch: dict[str, Any] = {"props": card.props.model_dump(mode="python")}
@@ -1550,11 +2094,14 @@ class AIRunner:
         )
       )
 
-    now = time.time()
-    next_timestamps = deque(self._create_timestamps)
-    while next_timestamps and now - next_timestamps[0] > 60.0:
-      next_timestamps.popleft()
-    next_last_create = self._last_create_at
+    # Accepted creates are only recorded (`_record_creates`) once the caller's state apply succeeds.
+    now = time.monotonic()
+    timestamps = self._create_timestamps
+    while timestamps and now - timestamps[0] > 60.0:
+      timestamps.popleft()
+    free_slots = timestamps.maxlen - len(timestamps)
+    last_create = self._last_create_at
+    created_at: list[float] = []
 
     throttled = 0
     output: list[BoardAction] = []
@@ -1566,17 +2113,17 @@ class AIRunner:
         output.append(action)
         continue
 
-      if min_between_s > 0 and now - next_last_create < min_between_s:
+      if min_between_s > 0 and now - last_create < min_between_s:
         throttled += 1
         continue
 
-      if max_per_minute <= 0 or len(next_timestamps) >= max_per_minute:
+      if len(created_at) >= free_slots:
         throttled += 1
         continue
 
       output.append(action)
-      next_timestamps.append(now)
-      next_last_create = now
+      created_at.append(now)
+      last_create = now
 
     msg = None
     if throttled:
@@ -1585,56 +2132,58 @@ class AIRunner:
         f"(max {max_per_minute}/min, min {int(min_between_s)}s between creates)."
       )
 
-    return output, msg, next_timestamps, next_last_create
+    return output, msg, created_at
+
+  def _record_creates(self, created_at: list[float]) -> None:
+    if created_at:
+      self._create_timestamps.extend(created_at)
+      self._last_create_at = created_at[-1]
 
 
 class MindmapAIRunner:
   def __init__(self, state: RealtimeState) -> None:
     self._state = state
     self._min_interval_s = _env_float("MEETINGGENIUS_MINDMAP_AI_MIN_INTERVAL_SECONDS", 2.5)
-    self._lock = asyncio.Lock()
+    self._model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
     self._task: asyncio.Task[None] | None = None
     self._pending = False
-    self._last_started_at = 0.0
+    self._last_started_at = float("-inf")
     self._last_processed_transcript_version = -1
     self._warned_missing_ai_config = False
 
   async def request(self) -> None:
-    async with self._lock:
-      self._pending = True
-      if self._task is None or self._task.done():
-        self._task = asyncio.create_task(self._run_loop())
+    self._pending = True
+    if self._task is None or self._task.done():
+      self._task = asyncio.create_task(self._run_loop())
 
   async def _run_loop(self) -> None:
     while True:
-      async with self._lock:
-        if not self._pending:
-          return
-        self._pending = False
-        delay = max(0.0, self._min_interval_s - (time.time() - self._last_started_at))
+      if not self._pending:
+        return
+      self._pending = False
+      delay = max(0.0, self._min_interval_s - (time.monotonic() - self._last_started_at))
 
       if delay > 0:
         await asyncio.sleep(delay)
 
-      self._last_started_at = time.time()
+      self._last_started_at = time.monotonic()
       try:
         await self._run_once()
       except Exception as e:
-        model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
         await self._state.error(
-          _humanize_ai_error(e, model=model),
+          _humanize_ai_error(e, model=self._model),
           details={"error": str(e), "traceback": traceback.format_exc(limit=25)},
         )
 
   async def _run_once(self) -> None:
-    _, transcript_version, events, mindmap_state, mindmap_ai_override = await self._state.snapshot_mindmap_ai()
-    if not events:
+    if self._state.transcript_version == self._last_processed_transcript_version:
       return
-    if transcript_version == self._last_processed_transcript_version:
+    _, transcript_version, transcript, mindmap_state, mindmap_ai_override = await self._state.snapshot_mindmap_ai()
+    if transcript.latest is None:
       return
 
     mindmap_ai_enabled = (
-      mindmap_ai_override if mindmap_ai_override is not None else _env_bool("MEETINGGENIUS_MINDMAP_AI", True)
+      mindmap_ai_override if mindmap_ai_override is not None else self._state.mindmap_ai_default
     )
     if not mindmap_ai_enabled:
       return
@@ -1642,14 +2191,7 @@ class MindmapAIRunner:
     extractor_mode = _mindmap_extractor_mode()
 
     # Use a stable window: last N final events + the most recent interim event (if any).
-    final_events = [e for e in events if e.is_final]
-    window: list[TranscriptEvent] = final_events[-18:]
-    latest_interim = next((e for e in reversed(events) if not e.is_final), None)
-    if latest_interim is not None:
-      if not window or latest_interim.timestamp >= window[-1].timestamp:
-        if len(latest_interim.text.strip()) >= 24:
-          window = window + [latest_interim]
-
+    window = transcript.events
     if not window:
       return
 
@@ -1661,7 +2203,7 @@ class MindmapAIRunner:
       finally:
         await self._state.broadcast({"type": "mindmap_status", "status": "idle"})
     else:
-      model = os.getenv("MEETINGGENIUS_MODEL") or "openai:gpt-4o-mini"
+      model = self._model
       missing_ai_hint = _missing_ai_config_hint(model)
       if missing_ai_hint is not None:
         if not self._warned_missing_ai_config:
@@ -1697,12 +2239,12 @@ class MindmapAIRunner:
       deps = MindmapExtractorDeps(policy=policy, mindmap_state=mindmap_state)
       await self._state.broadcast({"type": "mindmap_status", "status": "running"})
       try:
-        proposals = await asyncio.to_thread(lambda: extractor.run_sync(prompt, deps=deps).output)
+        proposals = (await extractor.run(prompt, deps=deps)).output
       finally:
         await self._state.broadcast({"type": "mindmap_status", "status": "idle"})
 
-    has_any_final = any(e.is_final for e in events)
-    latest_event = events[-1] if events else None
+    has_any_final = transcript.has_final
+    latest_event = transcript.latest
 
     max_new_nodes = _env_int("MEETINGGENIUS_MINDMAP_MAX_NEW_NODES_PER_RUN", 12)
     max_new_root_topics = _env_int("MEETINGGENIUS_MINDMAP_MAX_NEW_ROOT_TOPICS_PER_RUN", 4)
@@ -1722,14 +2264,8 @@ class MindmapAIRunner:
       max_new_root_topics=max_new_root_topics,
     )
     if actions:
-      _, applied_state = await self._state.apply_mindmap_actions_now(actions)
-      await self._state.broadcast(
-        {
-          "type": "mindmap_actions",
-          "actions": _mindmap_actions_to_json(actions),
-          "state": _mindmap_state_to_json(applied_state),
-        }
-      )
+      applied_version, applied_state = await self._state.apply_mindmap_actions_now(actions)
+      await self._state.broadcast_mindmap(_mindmap_actions_to_json(actions), applied_state, applied_version)
 
     self._last_processed_transcript_version = transcript_version
 
@@ -1740,14 +2276,13 @@ STATE.mindmap_ai_runner = MindmapAIRunner(STATE)
 
 
 async def _persistence_snapshot() -> tuple[BoardState, MindmapState, str | None, bool | None, bool | None]:
-  async with STATE.state_lock:
-    return (
-      STATE.board_state,
-      STATE.mindmap_state,
-      STATE.default_location,
-      STATE.no_browse_override,
-      STATE.mindmap_ai_override,
-    )
+  return (
+    STATE.board_state,
+    STATE.mindmap_state,
+    STATE.default_location,
+    STATE.no_browse_override,
+    STATE.mindmap_ai_override,
+  )
 
 
 @app.on_event("startup")
@@ -1784,7 +2319,7 @@ async def _load_persisted_state() -> None:
   if board_state is None and mindmap_state is None and default_location is None and no_browse is None and mindmap_ai is None:
     return
 
-  async with STATE.state_lock:
+  async with STATE.settings_lock, STATE.board_lock, STATE.mindmap_lock:
     if board_state is not None:
       STATE.board_state = board_state
     if mindmap_state is not None:
@@ -1794,27 +2329,47 @@ async def _load_persisted_state() -> None:
     STATE.mindmap_ai_override = mindmap_ai
 
 
+async def _receive_json(ws: WebSocket) -> Any:
+  # Like `WebSocket.receive_json()`, but accepts JSON in either text or binary frames.
+  message = await ws.receive()
+  if message["type"] == "websocket.disconnect":
+    raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+  raw = message.get("text")
+  if raw is None:
+    raw = message.get("bytes") or b""
+  if orjson is not None:
+    return orjson.loads(raw)
+  return json.loads(raw)
+
+
 @app.websocket("/ws")
 async def ws_endpoint(ws: WebSocket) -> None:
   await ws.accept()
   await STATE.add_client(ws)
   try:
-    await ws.send_json({"type": "status", "message": "Connected."})
-    _, _, board_state = await STATE.snapshot()
-    await ws.send_json({"type": "board_actions", "actions": [], "state": _state_to_json(board_state)})
-    mindmap_state = await STATE.get_mindmap_state()
-    await ws.send_json({"type": "mindmap_actions", "actions": [], "state": _mindmap_state_to_json(mindmap_state)})
-    await ws.send_json({"type": "mindmap_status", "status": "idle"})
+    await ws.send_text(_WS_CONNECTED_TEXT)
+    await _send_json(ws, STATE.board_state_message())
+    await _send_json(ws, STATE.mindmap_state_message())
+    await ws.send_text(_WS_MINDMAP_IDLE_TEXT)
 
     while True:
-      data = await ws.receive_json()
+      try:
+        data = await _receive_json(ws)
+      except ValueError:
+        await ws.send_text(_WS_INVALID_JSON_TEXT)
+        continue
       if not isinstance(data, dict):
-        await ws.send_json({"type": "error", "message": "Invalid message; expected JSON object."})
+        await ws.send_text(_WS_NOT_AN_OBJECT_TEXT)
         continue
 
       msg_type = data.get("type")
       if msg_type == "ping":
-        await ws.send_json({"type": "pong"})
+        await ws.send_text(_WS_PONG_TEXT)
+        continue
+
+      if msg_type == "sync":
+        for message in await STATE.sync_messages():
+          await _send_json(ws, message)
         continue
 
       if msg_type == "reset":
@@ -1822,29 +2377,24 @@ async def ws_endpoint(ws: WebSocket) -> None:
         continue
 
       if msg_type == "export_board":
-        await ws.send_json(await STATE.board_export_payload())
+        await _send_json(ws, await STATE.board_export_payload())
         continue
 
       if msg_type == "import_board":
         raw_state = data.get("state")
         if not isinstance(raw_state, dict):
-          await ws.send_json(
-            {
-              "type": "error",
-              "message": "Invalid import_board payload.",
-              "details": {"state": "Expected JSON object."},
-            }
-          )
+          await ws.send_text(_WS_INVALID_IMPORT_STATE_TEXT)
           continue
 
         try:
           next_board_state = BoardState.model_validate(raw_state)
         except ValidationError as e:
-          await ws.send_json(
+          await _send_json(
+            ws,
             {
               "type": "error",
               "message": "Invalid import_board payload.",
-              "details": {"errors": e.errors()},
+              "details": {"errors": _validation_errors(e)},
             }
           )
           continue
@@ -1858,13 +2408,7 @@ async def ws_endpoint(ws: WebSocket) -> None:
           elif isinstance(raw_location, str) and raw_location.strip():
             default_location = raw_location.strip()
           else:
-            await ws.send_json(
-              {
-                "type": "error",
-                "message": "Invalid import_board payload.",
-                "details": {"default_location": "Expected non-empty string or null."},
-              }
-            )
+            await ws.send_text(_WS_INVALID_IMPORT_LOCATION_TEXT)
             continue
 
         has_no_browse = "no_browse" in data
@@ -1874,16 +2418,10 @@ async def ws_endpoint(ws: WebSocket) -> None:
           if raw_no_browse is None or isinstance(raw_no_browse, bool):
             no_browse = raw_no_browse
           else:
-            await ws.send_json(
-              {
-                "type": "error",
-                "message": "Invalid import_board payload.",
-                "details": {"no_browse": "Expected boolean or null."},
-              }
-            )
+            await ws.send_text(_WS_INVALID_IMPORT_NO_BROWSE_TEXT)
             continue
 
-        imported_state = await STATE.replace_board_state(
+        imported_version, imported_state = await STATE.replace_board_state(
           next_board_state,
           has_default_location=has_default_location,
           default_location=default_location,
@@ -1891,51 +2429,32 @@ async def ws_endpoint(ws: WebSocket) -> None:
           no_browse=no_browse,
         )
 
-        if PERSISTOR is not None:
-          await PERSISTOR.save_now()
-
         await STATE.status("Board imported.")
-        await STATE.broadcast({"type": "board_actions", "actions": [], "state": _state_to_json(imported_state)})
+        await STATE.broadcast_board([], imported_state, imported_version, full_state=True)
         continue
 
       if msg_type == "transcript_event":
         try:
           event = TranscriptEvent.model_validate(data.get("event"))
         except ValidationError as e:
-          await ws.send_json(
+          await _send_json(
+            ws,
             {
               "type": "error",
               "message": "Invalid transcript_event payload.",
-              "details": {"errors": e.errors()},
+              "details": {"errors": _validation_errors(e)},
             }
           )
           continue
 
         await STATE.add_transcript_event(event)
-        updated = await STATE.update_meeting_native_mindmap()
-        if updated is not None:
-          actions, next_state = updated
-          await STATE.broadcast(
-            {
-              "type": "mindmap_actions",
-              "actions": _mindmap_actions_to_json(actions),
-              "state": _mindmap_state_to_json(next_state),
-            }
-          )
-        mindmap_ai_override = await STATE.get_mindmap_ai_override()
-        mindmap_ai_enabled = (
-          mindmap_ai_override if mindmap_ai_override is not None else _env_bool("MEETINGGENIUS_MINDMAP_AI", True)
-        )
-        if mindmap_ai_enabled and STATE.mindmap_ai_runner is not None:
-          await STATE.mindmap_ai_runner.request()
-        if event.is_final and STATE.ai_runner is not None:
-          await STATE.ai_runner.request()
+        STATE.request_transcript_followup(is_final=event.is_final)
         continue
 
       if msg_type == "run_ai":
-        await ws.send_json({"type": "status", "message": "AI run requested by user."})
+        await ws.send_text(_WS_AI_RUN_REQUESTED_TEXT)
         if STATE.ai_runner is not None:
-          await STATE.ai_runner.request()
+          await STATE.ai_runner.request(force=True)
         continue
 
       if msg_type == "set_session_context":
@@ -1944,13 +2463,7 @@ async def ws_endpoint(ws: WebSocket) -> None:
         if has_default_location:
           raw_location = data.get("default_location")
           if not isinstance(raw_location, str) or not raw_location.strip():
-            await ws.send_json(
-              {
-                "type": "error",
-                "message": "Invalid set_session_context payload.",
-                "details": {"default_location": "Expected non-empty string."},
-              }
-            )
+            await ws.send_text(_WS_INVALID_CONTEXT_LOCATION_TEXT)
             continue
           default_location = raw_location.strip()
 
@@ -1958,13 +2471,7 @@ async def ws_endpoint(ws: WebSocket) -> None:
         if "no_browse" in data:
           raw_no_browse = data.get("no_browse")
           if not isinstance(raw_no_browse, bool):
-            await ws.send_json(
-              {
-                "type": "error",
-                "message": "Invalid set_session_context payload.",
-                "details": {"no_browse": "Expected boolean."},
-              }
-            )
+            await ws.send_text(_WS_INVALID_CONTEXT_NO_BROWSE_TEXT)
             continue
           no_browse = raw_no_browse
 
@@ -1972,13 +2479,7 @@ async def ws_endpoint(ws: WebSocket) -> None:
         if "mindmap_ai" in data:
           raw_mindmap_ai = data.get("mindmap_ai")
           if not isinstance(raw_mindmap_ai, bool):
-            await ws.send_json(
-              {
-                "type": "error",
-                "message": "Invalid set_session_context payload.",
-                "details": {"mindmap_ai": "Expected boolean."},
-              }
-            )
+            await ws.send_text(_WS_INVALID_CONTEXT_MINDMAP_AI_TEXT)
             continue
           mindmap_ai = raw_mindmap_ai
 
@@ -1987,8 +2488,7 @@ async def ws_endpoint(ws: WebSocket) -> None:
         else:
           current_default = await STATE.get_default_location()
           if current_default is None:
-            fallback_location = os.getenv("MEETINGGENIUS_DEFAULT_LOCATION") or "Seattle"
-            await STATE.set_default_location(fallback_location)
+            await STATE.set_default_location(STATE.default_location_fallback)
         if no_browse is not None:
           await STATE.set_no_browse_override(no_browse)
         if mindmap_ai is not None:
@@ -2003,7 +2503,8 @@ async def ws_endpoint(ws: WebSocket) -> None:
           parts.append(f"mindmap_ai={'on' if mindmap_ai else 'off'}")
         updated = no_browse is not None or mindmap_ai is not None
 
-        await ws.send_json(
+        await _send_json(
+          ws,
           {
             "type": "status",
             "message": (
@@ -2020,103 +2521,73 @@ async def ws_endpoint(ws: WebSocket) -> None:
       if msg_type == "client_board_action":
         raw_action = data.get("action")
         if not isinstance(raw_action, dict):
-          await ws.send_json(
-            {
-              "type": "error",
-              "message": "Invalid client_board_action payload.",
-              "details": {"action": "Expected JSON object."},
-            }
-          )
+          await ws.send_text(_WS_INVALID_BOARD_ACTION_TEXT)
           continue
 
         try:
-          action = TypeAdapter(BoardAction).validate_python(raw_action)
+          action = _BOARD_ACTION_ADAPTER.validate_python(raw_action)
         except ValidationError as e:
-          await ws.send_json(
+          await _send_json(
+            ws,
             {
               "type": "error",
               "message": "Invalid board action payload.",
-              "details": {"errors": e.errors()},
+              "details": {"errors": _validation_errors(e)},
             }
           )
           continue
 
-        if getattr(action, "type", None) not in {"move_card", "dismiss_card"}:
-          await ws.send_json(
+        if action.type not in _CLIENT_BOARD_ACTION_TYPE_SET:
+          await _send_json(
+            ws,
             {
               "type": "error",
               "message": "Unsupported board action type.",
-              "details": {"allowed": ["move_card", "dismiss_card"], "type": getattr(action, "type", None)},
+              "details": {"allowed": list(CLIENT_BOARD_ACTION_TYPES), "type": action.type},
             }
           )
           continue
 
-        _, next_state = await STATE.apply_board_actions_now([action])
-        await STATE.broadcast(
-          {"type": "board_actions", "actions": _actions_to_json([action]), "state": _state_to_json(next_state)}
-        )
+        next_version, next_state = await STATE.apply_board_actions_now([action])
+        await STATE.broadcast_board(_actions_to_json([action]), next_state, next_version)
         continue
 
       if msg_type == "client_mindmap_action":
         raw_action = data.get("action")
         if not isinstance(raw_action, dict):
-          await ws.send_json(
-            {
-              "type": "error",
-              "message": "Invalid client_mindmap_action payload.",
-              "details": {"action": "Expected JSON object."},
-            }
-          )
+          await ws.send_text(_WS_INVALID_MINDMAP_ACTION_TEXT)
           continue
 
         try:
-          action = TypeAdapter(MindmapAction).validate_python(raw_action)
+          action = _MINDMAP_ACTION_ADAPTER.validate_python(raw_action)
         except ValidationError as e:
-          await ws.send_json(
+          await _send_json(
+            ws,
             {
               "type": "error",
               "message": "Invalid mindmap action payload.",
-              "details": {"errors": e.errors()},
+              "details": {"errors": _validation_errors(e)},
             }
           )
           continue
 
-        if getattr(action, "type", None) not in {
-          "set_node_pos",
-          "set_collapsed",
-          "rename_node",
-          "reparent_node",
-          "delete_subtree",
-        }:
-          await ws.send_json(
+        if action.type not in _CLIENT_MINDMAP_ACTION_TYPE_SET:
+          await _send_json(
+            ws,
             {
               "type": "error",
               "message": "Unsupported mindmap action type.",
-              "details": {
-                "allowed": [
-                  "set_node_pos",
-                  "set_collapsed",
-                  "rename_node",
-                  "reparent_node",
-                  "delete_subtree",
-                ],
-                "type": getattr(action, "type", None),
-              },
+              "details": {"allowed": list(CLIENT_MINDMAP_ACTION_TYPES), "type": action.type},
             }
           )
           continue
 
-        _, next_state = await STATE.apply_mindmap_actions_now([action])
-        await STATE.broadcast(
-          {
-            "type": "mindmap_actions",
-            "actions": _mindmap_actions_to_json([action]),
-            "state": _mindmap_state_to_json(next_state),
-          }
-        )
+        next_version, next_state = await STATE.apply_mindmap_actions_now([action])
+        await STATE.broadcast_mindmap(_mindmap_actions_to_json([action]), next_state, next_version)
         continue
 
-      await ws.send_json(
+      await _send_json(
+        ws,
         {"type": "error", "message": f"Unknown message type: {msg_type!r}", "details": {"type": msg_type}}
       )
 
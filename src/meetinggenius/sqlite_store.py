@@ -12,6 +12,11 @@ from typing import Any, Awaitable, Callable
 
 from meetinggenius.contracts import BoardState, MindmapState
 
+try:
+  import orjson
+except ModuleNotFoundError:
+  orjson = None
+
 
 BOARD_STATE_KEY = "board_state"
 MINDMAP_STATE_KEY = "mindmap_state"
@@ -78,49 +83,62 @@ class SQLiteKVStore:
       conn.executemany("DELETE FROM kv WHERE key = ?", [(k,) for k in keys])
 
 
+def _json_loads(value_json: str) -> Any:
+  if orjson is not None:
+    return orjson.loads(value_json)
+  return json.loads(value_json)
+
+
+def _json_dumps(value: Any) -> str:
+  # Compact, non-ASCII-preserving text either way.
+  if orjson is not None:
+    return orjson.dumps(value).decode("utf-8")
+  return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
 def load_board_state(value_json: str) -> BoardState:
-  data = json.loads(value_json)
+  data = _json_loads(value_json)
   return BoardState.model_validate(data)
 
 
 def load_mindmap_state(value_json: str) -> MindmapState:
-  data = json.loads(value_json)
+  data = _json_loads(value_json)
   return MindmapState.model_validate(data)
 
 
 def load_default_location(value_json: str) -> str | None:
-  value = json.loads(value_json)
+  value = _json_loads(value_json)
   return value if isinstance(value, str) and value.strip() else None
 
 
 def load_no_browse(value_json: str) -> bool | None:
-  value = json.loads(value_json)
+  value = _json_loads(value_json)
   return value if isinstance(value, bool) else None
 
 
 def load_mindmap_ai(value_json: str) -> bool | None:
-  value = json.loads(value_json)
+  value = _json_loads(value_json)
   return value if isinstance(value, bool) else None
 
 
 def dump_board_state(state: BoardState) -> str:
-  return json.dumps(state.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":"))
+  return _json_dumps(state.model_dump(mode="json"))
 
 
 def dump_mindmap_state(state: MindmapState) -> str:
-  return json.dumps(state.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":"))
+  return _json_dumps(state.model_dump(mode="json"))
 
 
 def dump_default_location(value: str | None) -> str:
-  return json.dumps(value, ensure_ascii=False)
+  return _json_dumps(value)
 
 
 def dump_no_browse(value: bool | None) -> str:
-  return json.dumps(value, ensure_ascii=False)
+  return _json_dumps(value)
 
 
 def dump_mindmap_ai(value: bool | None) -> str:
-  return json.dumps(value, ensure_ascii=False)
+  return _json_dumps(value)
 
 
 @dataclass
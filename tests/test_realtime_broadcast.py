@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import unittest
+from typing import Any
+
+from meetinggenius.contracts import (
+  CreateCardAction,
+  ListCard,
+  ListCardProps,
+  MindmapNode,
+  UpsertMindmapNodeAction,
+)
+from meetinggenius.server import (
+  RealtimeState,
+  _actions_to_json,
+  _mindmap_actions_to_json,
+  _mindmap_state_to_json,
+  _state_to_json,
+)
+
+
+class _ReplayClient:
+  # Fake socket that applies board/mindmap frames the way the web client does.
+  def __init__(self) -> None:
+    self.states: dict[str, dict[str, Any]] = {}
+    self.versions: dict[str, int] = {}
+    self.actions: dict[str, list[dict[str, Any]]] = {}
+    self.needs_sync = False
+    self.syncs = 0
+    self.drop_next = False
+
+  async def send_text(self, text: str) -> None:
+    if self.drop_next:
+      self.drop_next = False
+      return
+    message = json.loads(text)
+    for item in message["messages"] if message["type"] == "batch" else [message]:
+      self.receive(item)
+
+  def receive(self, message: dict[str, Any]) -> None:
+    kind = message["type"]
+    if kind not in ("board_actions", "mindmap_actions"):
+      return
+    if "state" in message:
+      self.states[kind] = message["state"]
+      self.needs_sync = False
+    elif message["base_version"] != self.versions.get(kind):
+      if not self.needs_sync:
+        self.needs_sync = True
+        self.syncs += 1
+      return
+    else:
+      state = self.states[kind]
+      for section, entries in message["patch"].items():
+        if section == "root_id":
+          state["root_id"] = entries
+          continue
+        for key, value in entries.items():
+          if value is None:
+            state[section].pop(key, None)
+          else:
+            state[section][key] = value
+    self.versions[kind] = message["version"]
+    self.actions[kind] = message["actions"]
+
+
+class BroadcastReplayTest(unittest.IsolatedAsyncioTestCase):
+  async def asyncSetUp(self) -> None:
+    # A long batch window, so each test decides when queued broadcasts go out.
+    self.state = RealtimeState(broadcast_batch_seconds=60)
+    self.client = _ReplayClient()
+    await self.state.add_client(self.client)  # type: ignore[arg-type]
+    self.client.receive(self.state.board_state_message())
+    self.client.receive(self.state.mindmap_state_message())
+    self.step = 0
+
+  async def asyncTearDown(self) -> None:
+    if self.state.broadcast_flush_task is not None:
+      self.state.broadcast_flush_task.cancel()
+
+  async def _update(self) -> None:
+    self.step += 1
+    card = ListCard(card_id=f"card-{self.step}", kind="list", props=ListCardProps(title="Notes", items=[]))
+    board_actions = [CreateCardAction(card=card)]
+    version, board = await self.state.apply_board_actions_now(board_actions)
+    await self.state.broadcast_board(_actions_to_json(board_actions), board, version)
+    node = MindmapNode(node_id=f"node-{self.step}", text=f"Topic {self.step}")
+    mindmap_actions = [UpsertMindmapNodeAction(node=node)]
+    version, mindmap = await self.state.apply_mindmap_actions_now(mindmap_actions)
+    await self.state.broadcast_mindmap(_mindmap_actions_to_json(mindmap_actions), mindmap, version)
+
+  async def _sync(self) -> None:
+    for message in await self.state.sync_messages():
+      self.client.receive(message)
+
+  def assertInSync(self) -> None:
+    self.assertFalse(self.client.needs_sync)
+    self.assertEqual(self.client.states["board_actions"], _state_to_json(self.state.board_state))
+    self.assertEqual(self.client.states["mindmap_actions"], _mindmap_state_to_json(self.state.mindmap_state))
+    self.assertEqual(self.client.versions["board_actions"], self.state.version)
+    self.assertEqual(self.client.versions["mindmap_actions"], self.state.mindmap_version)
+
+  async def test_patches_replay_to_server_state(self) -> None:
+    for _ in range(3):
+      await self._update()
+      await self._update()
+      await self.state.flush_broadcasts()
+    self.assertInSync()
+
+  async def test_gap_recovers_with_one_sync(self) -> None:
+    await self._update()
+    await self.state.flush_broadcasts()
+    self.client.drop_next = True
+    await self._update()
+    await self.state.flush_broadcasts()
+    await self._update()
+    await self.state.flush_broadcasts()
+    self.assertTrue(self.client.needs_sync)
+
+    # An update still queued when the sync arrives must not trigger a second sync.
+    await self._update()
+    await self._sync()
+    await self._update()
+    await self.state.flush_broadcasts()
+    self.assertInSync()
+    self.assertEqual(self.client.syncs, 1)
+
+  async def test_reset_replaces_queued_updates(self) -> None:
+    await self._update()
+    await self.state.flush_broadcasts()
+    await self._update()
+    await self.state.reset()
+    await self.state.flush_broadcasts()
+    self.assertInSync()
+    self.assertEqual(self.client.states["board_actions"]["cards"], {})
+    self.assertEqual(self.client.actions["board_actions"], [])
+    self.assertEqual(self.client.syncs, 0)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import math
+import unittest
+
+from pydantic import ValidationError
+
+from meetinggenius.contracts import BoardState, MindmapPoint, MindmapState, Rect
+from meetinggenius.sqlite_store import (
+  dump_board_state,
+  dump_mindmap_state,
+  load_board_state,
+  load_mindmap_state,
+)
+
+
+class PersistedStateRoundTripTest(unittest.TestCase):
+  def test_mindmap_state_round_trips(self) -> None:
+    state = MindmapState(layout={"mm:root": MindmapPoint(x=-12.5, y=1e6)})
+    self.assertEqual(load_mindmap_state(dump_mindmap_state(state)), state)
+
+  def test_board_state_round_trips(self) -> None:
+    state = BoardState(layout={"card-1": Rect(x=0.5, y=-3.0, w=420.0, h=280.0)})
+    self.assertEqual(load_board_state(dump_board_state(state)), state)
+
+  def test_non_finite_coordinates_are_rejected(self) -> None:
+    # JSON can't carry them (orjson writes null), so a state holding one could not be reloaded.
+    for value in (math.inf, -math.inf, math.nan):
+      with self.assertRaises(ValidationError):
+        MindmapPoint(x=value, y=0)
+      with self.assertRaises(ValidationError):
+        Rect(x=0, y=value, w=1, h=1)
+
+
+if __name__ == "__main__":
+  unittest.main()